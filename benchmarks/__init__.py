@@ -0,0 +1,4 @@
+"""
+Benchmarks for the data structures used by the maze and hollows.
+Run them from the repository root, e.g. `python -m benchmarks.heap_arity`.
+"""
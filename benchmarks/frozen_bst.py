@@ -0,0 +1,71 @@
+"""
+Compares lookups in the linked BetterBST with its frozen Eytzinger-layout copy.
+
+Every key is looked up once in random order, then as many absent keys, timed
+separately: a linked `in` raises and catches a KeyError on every miss, which the
+frozen tree does not, so a mixed run would blur the two. The floor queries of the
+frozen tree over both sets are timed alongside.
+
+Usage:
+    python -m benchmarks.frozen_bst [--sizes N ...] [--repeat R]
+"""
+from __future__ import annotations
+
+import argparse
+from random import Random
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_time
+from betterbst import BetterBST
+from data_structures.eytzinger import FrozenBST
+
+
+def lookups(tree, keys: List[int]) -> Callable[[], None]:
+    def run() -> None:
+        for key in keys:
+            key in tree
+    return run
+
+
+def floors(tree: FrozenBST[int, int], keys: List[int]) -> Callable[[], None]:
+    def run() -> None:
+        for key in keys:
+            tree.floor(key)
+    return run
+
+
+def compare(size: int, repeat: int, rng: Random) -> None:
+    """Prints lookups per second of both layouts for a tree of `size` keys."""
+    elements: List[Tuple[int, int]] = [(2 * key, key) for key in range(size)]
+    linked: BetterBST[int, int] = BetterBST(elements)
+    frozen: FrozenBST[int, int] = FrozenBST.from_tree(linked)
+    present: List[int] = [2 * key for key in range(size)]
+    absent: List[int] = [2 * key + 1 for key in range(size)]
+    rng.shuffle(present)
+    rng.shuffle(absent)
+
+    columns: List[str] = []
+    for queries in (present, absent):
+        linked_time = best_time(lookups(linked, queries), repeat)
+        frozen_time = best_time(lookups(frozen, queries), repeat)
+        columns.append(f"{size / linked_time:>14,.0f} {size / frozen_time:>14,.0f} {linked_time / frozen_time:>8.2f}x")
+    floor_time = best_time(floors(frozen, present + absent), repeat)
+    print(f"{size:>9} {' '.join(columns)} {2 * size / floor_time:>14,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng: Random = Random(args.seed)
+    print(f"{'keys':>9} {'hit linked/s':>14} {'hit frozen/s':>14} {'speedup':>9} "
+          f"{'miss linked/s':>14} {'miss frozen/s':>14} {'speedup':>9} {'frozen floor/s':>14}")
+    for size in args.sizes:
+        compare(size, args.repeat, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares push, pop, heapify and priority update throughput of heaps with arity 2, 4 and 8.
+
+Two workloads are measured: treasure-sized heaps (the 10-20 treasures of a hollow,
+rebuilt many times) and maze-frontier-sized heaps (one large heap, as used by a search).
+
+Usage:
+    python -m benchmarks.heap_arity [--frontier-size N] [--repeat R]
+"""
+from __future__ import annotations
+
+import argparse
+from random import Random
+from typing import Callable, List, Tuple
+
+from benchmarks.timing import best_time
+from config import TreasureConfig
+from data_structures.heap import IndexedMaxHeap, KeyedMaxHeap, MaxHeap
+
+ARITIES: Tuple[int, ...] = (2, 4, 8)
+
+
+def push(priorities: List[float], arity: int) -> None:
+    heap: KeyedMaxHeap[int] = KeyedMaxHeap(1, resizable=True, arity=arity)
+    for i, priority in enumerate(priorities):
+        heap.add(i, priority)
+
+
+def pop(priorities: List[float], arity: int) -> Callable[[], None]:
+    handles: List[int] = list(range(len(priorities)))
+
+    def run() -> None:
+        heap: KeyedMaxHeap[int] = KeyedMaxHeap.heapify(handles, priorities=priorities, arity=arity)
+        for _ in range(len(heap)):
+            heap.get_max()
+    return run
+
+
+def heapify(values: List[float], arity: int) -> None:
+    MaxHeap.heapify(values, resizable=True, arity=arity)
+
+
+def update(priorities: List[float], updates: List[Tuple[int, float]], arity: int) -> Callable[[], None]:
+    handles: List[int] = list(range(len(priorities)))
+
+    def run() -> None:
+        heap: IndexedMaxHeap[int] = IndexedMaxHeap.heapify(handles, priorities=priorities, arity=arity)
+        for handle, priority in updates:
+            heap.update_priority(handle, priority)
+    return run
+
+
+def workload(name: str, size: int, batches: int, repeat: int, rng: Random) -> None:
+    """
+    Prints operations per second for `batches` heaps of `size` elements at every arity.
+    Priority updates mostly increase priorities, as a search lowering costs would.
+    """
+    data: List[List[float]] = [[rng.random() for _ in range(size)] for _ in range(batches)]
+    updates: List[List[Tuple[int, float]]] = [[(rng.randrange(size), 1 + rng.random()) for _ in range(size)]
+                                              for _ in range(batches)]
+    operations: int = size * batches
+    print(f"\n{name}: {batches} heap(s) of {size} elements")
+    print(f"{'arity':>5} {'push/s':>12} {'pop/s':>12} {'heapify/s':>12} {'update/s':>12}")
+    for arity in ARITIES:
+        push_time = best_time(lambda: [push(batch, arity) for batch in data], repeat)
+        poppers = [pop(batch, arity) for batch in data]
+        pop_time = best_time(lambda: [run() for run in poppers], repeat)
+        heapify_time = best_time(lambda: [heapify(batch, arity) for batch in data], repeat)
+        updaters = [update(batch, changes, arity) for batch, changes in zip(data, updates)]
+        update_time = best_time(lambda: [run() for run in updaters], repeat)
+        print(f"{arity:>5} {operations / push_time:>12,.0f} {operations / pop_time:>12,.0f} "
+              f"{operations / heapify_time:>12,.0f} {operations / update_time:>12,.0f}")
+    print("pop and update include building their heap with heapify")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frontier-size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng: Random = Random(args.seed)
+    workload("treasure", TreasureConfig.MAX_NUMBER_OF_TREASURES.value, 2_000, args.repeat, rng)
+    workload("frontier", args.frontier_size, 1, args.repeat, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares LinkedStack with ArrayStack, on their own and as the stack of a BST traversal.
+
+Usage:
+    python -m benchmarks.stacks [--size N] [--repeat R]
+"""
+from __future__ import annotations
+
+import argparse
+from random import Random
+from typing import Callable, List
+
+from benchmarks.timing import best_time
+from data_structures.array_stack import ArrayStack
+from data_structures.bst import BinarySearchTree, in_order
+from data_structures.linked_stack import LinkedStack
+from data_structures.stack_adt import Stack
+
+
+def push_pop(stack: Stack[int], size: int) -> Callable[[], None]:
+    def run() -> None:
+        for i in range(size):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return run
+
+
+def push_pop_many(stack: ArrayStack[int], size: int) -> Callable[[], None]:
+    items: List[int] = list(range(size))
+
+    def run() -> None:
+        stack.push_many(items)
+        stack.pop_many(size)
+    return run
+
+
+def traversal(tree: BinarySearchTree[int, int], stack: Stack | None) -> Callable[[], None]:
+    def run() -> None:
+        for _ in in_order(tree.root, stack):
+            pass
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    size: int = args.size
+
+    print(f"{'workload':<32} {'ops/s':>14}")
+    for name, run in [("LinkedStack push/pop", push_pop(LinkedStack(), size)),
+                      ("ArrayStack push/pop", push_pop(ArrayStack(), size)),
+                      ("ArrayStack push_many/pop_many", push_pop_many(ArrayStack(), size))]:
+        print(f"{name:<32} {2 * size / best_time(run, args.repeat):>14,.0f}")
+
+    tree: BinarySearchTree[int, int] = BinarySearchTree()
+    for key in Random(args.seed).sample(range(10 * size), size):
+        tree[key] = key
+    for name, stack in [("in-order on LinkedStack", LinkedStack()),
+                        ("in-order on ArrayStack", ArrayStack()),
+                        ("in-order on a list", None)]:
+        print(f"{name:<32} {size / best_time(traversal(tree, stack), args.repeat):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
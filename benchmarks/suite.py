@@ -0,0 +1,297 @@
+"""
+Scaling benchmarks for the data structures, with regression checks against a baseline.
+
+Every case times one core operation on structures of increasing size, fits the empirical
+complexity exponent b of time ~ n^b, and can compare the results with a stored baseline.
+benchmarks/baseline.json was saved with the default options, e.g. compare against it with
+`python -m benchmarks --baseline benchmarks/baseline.json`; timings only compare on the same machine.
+
+Usage:
+    python -m benchmarks [--max-size N] [--csv FILE] [--json FILE]
+                         [--baseline FILE] [--save-baseline FILE]
+                         [--threshold RATIO] [--exponent-threshold DELTA] [--cases NAME ...]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from betterbst import BetterBST
+from data_structures.array_stack import ArrayStack
+from data_structures.avl import AVLTree
+from data_structures.bst import BinarySearchTree
+from data_structures.eytzinger import FrozenBST
+from data_structures.heap import MaxHeap
+from data_structures.linked_stack import LinkedStack
+from data_structures.referential_array import ArrayR
+
+DEFAULT_SIZES: Tuple[int, ...] = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+# A case turns (size, rng) into a zero-argument callable that performs `size` operations.
+Case = Callable[[int, Random], Callable[[], None]]
+
+
+@dataclass
+class Measurement:
+    case: str
+    size: int
+    seconds: float
+    ns_per_op: float
+
+
+@dataclass
+class Regression:
+    case: str
+    detail: str
+
+
+def heap_add(size: int, rng: Random) -> Callable[[], None]:
+    values: List[float] = [rng.random() for _ in range(size)]
+
+    def run() -> None:
+        heap: MaxHeap[float] = MaxHeap(size)
+        for value in values:
+            heap.add(value)
+    return run
+
+
+def heap_get_max(size: int, rng: Random) -> Callable[[], None]:
+    values: List[float] = [rng.random() for _ in range(size)]
+
+    def run() -> None:
+        heap: MaxHeap[float] = MaxHeap.heapify(values, resizable=True)
+        for _ in range(size):
+            heap.get_max()
+    return run
+
+
+def heap_heapify(size: int, rng: Random) -> Callable[[], None]:
+    values: List[float] = [rng.random() for _ in range(size)]
+    return lambda: MaxHeap.heapify(values, resizable=True)
+
+
+def bst_insert(size: int, rng: Random) -> Callable[[], None]:
+    keys: List[int] = rng.sample(range(10 * size), size)
+
+    def run() -> None:
+        tree: BinarySearchTree[int, int] = BinarySearchTree()
+        for key in keys:
+            tree[key] = key
+    return run
+
+
+def bst_lookup(size: int, rng: Random) -> Callable[[], None]:
+    keys: List[int] = rng.sample(range(10 * size), size)
+    tree: BinarySearchTree[int, int] = BinarySearchTree()
+    for key in keys:
+        tree[key] = key
+    rng.shuffle(keys)
+
+    def run() -> None:
+        for key in keys:
+            tree[key]
+    return run
+
+
+def avl_insert_random(size: int, rng: Random) -> Callable[[], None]:
+    keys: List[int] = rng.sample(range(10 * size), size)
+
+    def run() -> None:
+        tree: AVLTree[int, int] = AVLTree()
+        for key in keys:
+            tree[key] = key
+    return run
+
+
+def avl_insert_sorted(size: int, rng: Random) -> Callable[[], None]:
+    def run() -> None:
+        tree: AVLTree[int, int] = AVLTree()
+        for key in range(size):
+            tree[key] = key
+    return run
+
+
+def better_bst_build(size: int, rng: Random) -> Callable[[], None]:
+    elements: List[Tuple[int, int]] = [(key, key) for key in rng.sample(range(10 * size), size)]
+    return lambda: BetterBST(elements)
+
+
+def frozen_bst_lookup(size: int, rng: Random) -> Callable[[], None]:
+    keys: List[int] = rng.sample(range(10 * size), size)
+    tree: FrozenBST[int, int] = FrozenBST.from_tree(BetterBST([(key, key) for key in keys]))
+    rng.shuffle(keys)
+
+    def run() -> None:
+        for key in keys:
+            tree[key]
+    return run
+
+
+def stack_push_pop(size: int, rng: Random) -> Callable[[], None]:
+    def run() -> None:
+        stack: LinkedStack[int] = LinkedStack()
+        for i in range(size):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return run
+
+
+def array_stack_push_pop(size: int, rng: Random) -> Callable[[], None]:
+    def run() -> None:
+        stack: ArrayStack[int] = ArrayStack()
+        for i in range(size):
+            stack.push(i)
+        while not stack.is_empty():
+            stack.pop()
+    return run
+
+
+def array_set_get(size: int, rng: Random) -> Callable[[], None]:
+    array_r: ArrayR[int] = ArrayR(size)
+
+    def run() -> None:
+        for i in range(size):
+            array_r[i] = i
+        for i in range(size):
+            array_r[i]
+    return run
+
+
+CASES: Dict[str, Case] = {
+    "heap.add": heap_add,
+    "heap.get_max": heap_get_max,
+    "heap.heapify": heap_heapify,
+    "bst.insert": bst_insert,
+    "bst.lookup": bst_lookup,
+    "avl.insert_random": avl_insert_random,
+    "avl.insert_sorted": avl_insert_sorted,
+    "betterbst.build": better_bst_build,
+    "frozen_bst.lookup": frozen_bst_lookup,
+    "linked_stack.push_pop": stack_push_pop,
+    "array_stack.push_pop": array_stack_push_pop,
+    "array_r.set_get": array_set_get,
+}
+
+
+def measure(name: str, case: Case, size: int, seed: int, budget: float) -> Measurement:
+    """
+    Times the case at one size, repeating small sizes until `budget` seconds are spent
+    and keeping the fastest run.
+    """
+    run: Callable[[], None] = case(size, Random(seed))
+    best: float = float('inf')
+    spent: float = 0.0
+    while spent < budget or best == float('inf'):
+        start: float = time.perf_counter()
+        run()
+        elapsed: float = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+    return Measurement(name, size, best, 1e9 * best / size)
+
+
+def fit_exponent(measurements: List[Measurement]) -> float:
+    """
+    Least squares slope of log(seconds) against log(size): about 1 for linear work,
+    slightly above 1 for n log n and about 2 for quadratic.
+    """
+    xs: List[float] = [math.log(m.size) for m in measurements]
+    ys: List[float] = [math.log(m.seconds) for m in measurements]
+    if len(xs) < 2:
+        return float('nan')
+    mean_x: float = sum(xs) / len(xs)
+    mean_y: float = sum(ys) / len(ys)
+    covariance: float = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance: float = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def run_suite(names: List[str], sizes: List[int], seed: int, budget: float) -> Tuple[List[Measurement], Dict[str, float]]:
+    measurements: List[Measurement] = []
+    exponents: Dict[str, float] = {}
+    for name in names:
+        case_measurements: List[Measurement] = []
+        for size in sizes:
+            measurement = measure(name, CASES[name], size, seed, budget)
+            print(f"{name:<24} n={size:<9} {measurement.ns_per_op:>12,.1f} ns/op", file=sys.stderr)
+            case_measurements.append(measurement)
+        exponents[name] = fit_exponent(case_measurements)
+        print(f"{name:<24} exponent {exponents[name]:.2f}", file=sys.stderr)
+        measurements.extend(case_measurements)
+    return measurements, exponents
+
+
+def compare(measurements: List[Measurement], exponents: Dict[str, float], baseline: dict,
+            threshold: float, exponent_threshold: float) -> List[Regression]:
+    """
+    Flags sizes that are more than `threshold` (a ratio) slower per operation than the baseline,
+    and cases whose fitted exponent grew by more than `exponent_threshold`.
+    """
+    regressions: List[Regression] = []
+    previous: Dict[Tuple[str, int], float] = {(m["case"], m["size"]): m["ns_per_op"] for m in baseline["measurements"]}
+    for m in measurements:
+        before = previous.get((m.case, m.size))
+        if before is not None and m.ns_per_op > before * (1 + threshold):
+            regressions.append(Regression(m.case, f"n={m.size}: {m.ns_per_op:.1f} ns/op vs {before:.1f} baseline"))
+    for name, exponent in exponents.items():
+        before = baseline["exponents"].get(name)
+        if before is not None and exponent > before + exponent_threshold:
+            regressions.append(Regression(name, f"exponent {exponent:.2f} vs {before:.2f} baseline"))
+    return regressions
+
+
+def write_csv(path: str, measurements: List[Measurement]) -> None:
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["case", "size", "seconds", "ns_per_op"])
+        writer.writeheader()
+        for measurement in measurements:
+            writer.writerow(asdict(measurement))
+
+
+def write_json(path: str, measurements: List[Measurement], exponents: Dict[str, float]) -> None:
+    with open(path, 'w') as f:
+        json.dump({"measurements": [asdict(m) for m in measurements], "exponents": exponents}, f, indent=2)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1])
+    parser.add_argument("--budget", type=float, default=0.2, help="seconds to spend repeating each size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="write measurements to this CSV file")
+    parser.add_argument("--json", help="write measurements and exponents to this JSON file")
+    parser.add_argument("--save-baseline", help="write the results as a baseline JSON file")
+    parser.add_argument("--baseline", help="compare against this baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown per operation as a ratio, 0.25 is 25%% slower")
+    parser.add_argument("--exponent-threshold", type=float, default=0.15,
+                        help="allowed increase of a fitted complexity exponent")
+    args = parser.parse_args(argv)
+
+    sizes: List[int] = [size for size in DEFAULT_SIZES if size <= args.max_size]
+    measurements, exponents = run_suite(args.cases, sizes, args.seed, args.budget)
+    if args.csv:
+        write_csv(args.csv, measurements)
+    for path in (args.json, args.save_baseline):
+        if path:
+            write_json(path, measurements, exponents)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline: dict = json.load(f)
+        regressions = compare(measurements, exponents, baseline, args.threshold, args.exponent_threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.case}: {regression.detail}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+    return 0
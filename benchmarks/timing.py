@@ -0,0 +1,18 @@
+"""
+Timing helpers shared by the benchmark scripts.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+def best_time(run: Callable[[], None], repeat: int) -> float:
+    """Returns the fastest of `repeat` runs, in seconds."""
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
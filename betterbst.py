@@ -6,7 +6,7 @@ K = TypeVar('K')
 I = TypeVar('I')
 
 class BetterBST(BinarySearchTree[K, I]):
-    def __init__(self, elements: List[Tuple[K, I]]) -> None:
+    def __init__(self, elements: List[Tuple[K, I]] | None = None) -> None:
         """
         Initialiser for the BetterBST class.
         We assume that the all the elements that will be inserted
@@ -16,14 +16,20 @@ class BetterBST(BinarySearchTree[K, I]):
         using the corresponding methods below.
 
         Args:
-            elements(List[tuple[K, I]]): The elements to be inserted into the tree.
+            elements(List[tuple[K, I]] | None): The elements to be inserted into the tree,
+            None for an empty tree.
+
+        Raises:
+            ValueError: If two elements have the same key.
 
         Complexity:
-            Best Case Complexity: O(n * log(n))
+            Best Case Complexity: O(n) when the elements are already sorted.
             Worst Case Complexity: O(n * log(n))
             where n is the number of elements in the list.
         """
         super().__init__()
+        if elements is None:
+            elements = []
         # Sorting elements using custom merge sort
         new_elements: List[Tuple[K, I]] = self.__sort_elements(elements)
         # Building the balanced BST using sorted elements
@@ -31,77 +37,83 @@ class BetterBST(BinarySearchTree[K, I]):
 
     def __sort_elements(self, elements: List[Tuple[K, I]]) -> List[Tuple[K, I]]:
         """
-        Custom merge sort to sort the elements based on their keys.
+        Bottom-up merge sort of the elements based on their keys, without recursion or slicing.
+        Runs of doubling width are merged back and forth between a copy of the elements
+        and a single auxiliary buffer. Input that is already sorted is returned after one pass.
         We cannot use Python's built-in sorted() or .sort() as per the assignment restrictions.
 
         Args:
-            elements (List[Tuple[K, I]]): The elements we wish to sort.
+            elements (List[Tuple[K, I]]): The elements we wish to sort, left unchanged.
 
         Returns:
             list(Tuple[K, I]]) - elements after being sorted.
 
         Complexity:
-            Best Case Complexity: O(n log n)
+            Best Case Complexity: O(n) when the elements are already sorted.
             Worst Case Complexity: O(n log n)
         """
-        # Base case: if the list has 1 or fewer elements, it's already sorted
-        if len(elements) <= 1:
+        n = len(elements)
+        if self.__is_sorted(elements):
             return elements
-        
-        # Find the middle index
-        mid = len(elements) // 2
-        
-        # Recursively split and sort the left and right halves
-        left_half = self.__sort_elements(elements[:mid])
-        right_half = self.__sort_elements(elements[mid:])
-        
-        # Merge the sorted halves
-        return self.__merge(left_half, right_half)
-    
-    def __merge(self, left: List[Tuple[K, I]], right: List[Tuple[K, I]]) -> List[Tuple[K, I]]:
+
+        source: List[Tuple[K, I]] = list(elements)
+        buffer: List[Tuple[K, I]] = [None] * n
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                self.__merge(source, buffer, lo, mid, hi)
+            source, buffer = buffer, source
+            width *= 2
+        return source
+
+    @staticmethod
+    def __is_sorted(elements: List[Tuple[K, I]]) -> bool:
         """
-        Merge two sorted lists into one sorted list.
+        Checks whether the keys are already in non-decreasing order.
 
-        Args:
-            left (List[Tuple[K, I]]): Left sorted half.
-            right (List[Tuple[K, I]]): Right sorted half.
+        Complexity:
+            Best Case Complexity: O(1) when the first two keys are out of order.
+            Worst Case Complexity: O(n)
+        """
+        for i in range(1, len(elements)):
+            if elements[i][0] < elements[i - 1][0]:
+                return False
+        return True
 
-        Returns:
-            List[Tuple[K, I]] - Merged sorted list.
+    @staticmethod
+    def __merge(source: List[Tuple[K, I]], target: List[Tuple[K, I]], lo: int, mid: int, hi: int) -> None:
+        """
+        Merge the sorted runs source[lo:mid] and source[mid:hi] into target[lo:hi].
+
+        Args:
+            source (List[Tuple[K, I]]): Holds the two sorted runs.
+            target (List[Tuple[K, I]]): Receives the merged run.
+            lo (int): Start of the left run.
+            mid (int): End of the left run and start of the right run.
+            hi (int): End of the right run.
 
         Complexity:
-            Best Case Complexity: O(n)
-            Worst Case Complexity: O(n)
+            Best Case Complexity: O(hi - lo)
+            Worst Case Complexity: O(hi - lo)
         """
-        merged = []
-        i = j = 0
-        
-        # Merge the left and right lists
-        while i < len(left) and j < len(right):
-            if left[i][0] <= right[j][0]:  # Compare based on the key (first item in the tuple)
-                merged.append(left[i])
+        i, j = lo, mid
+        for k in range(lo, hi):
+            # Compare based on the key (first item in the tuple), taking from the left on ties
+            if j >= hi or (i < mid and source[i][0] <= source[j][0]):
+                target[k] = source[i]
                 i += 1
             else:
-                merged.append(right[j])
+                target[k] = source[j]
                 j += 1
-        
-        # Append any remaining elements
-        while i < len(left):
-            merged.append(left[i])
-            i += 1
-        
-        while j < len(right):
-            merged.append(right[j])
-            j += 1
-        
-        return merged
 
     def __build_balanced_tree(self, elements: List[Tuple[K, I]]) -> None:
         """
         This method will build a balanced binary search tree from the sorted elements.
-        We recursively choose the middle element to insert into the tree,
-        ensuring balance. The left half of the list becomes the left subtree,
-        and the right half becomes the right subtree.
+        The middle element of every index range becomes the root of that range's sub-tree,
+        linked directly to the roots of the left and right halves by link_sorted_aux without
+        walking from the root or slicing the list.
 
         Args:
             elements (List[Tuple[K, I]]): The elements we wish to use to build our balanced tree.
@@ -109,40 +121,35 @@ class BetterBST(BinarySearchTree[K, I]):
         Returns:
             None
 
+        Raises:
+            ValueError: If two elements have the same key.
+
         Complexity:
-            Best Case Complexity: O(n log n)
-            Worst Case Complexity: O(n log n)
+            Best Case Complexity: O(n)
+            Worst Case Complexity: O(n)
 
         Justification:
-            The method is recursive. At each recursion, we split the list into two halves, which is O(log n)
-            depth for the recursion tree. For each level, we perform O(n) work to insert the middle element.
-            This results in O(n log n) complexity.
+            Every element becomes exactly one node and every node is linked in O(1).
+            The recursion on index ranges is only O(log n) deep.
         """
-        if not elements:
-            return
-
-        # Find the middle index of the sorted list
-        mid = len(elements) // 2
-        key, item = elements[mid]
-        
-        # Insert the middle element into the binary search tree
-        self[key] = item
-
-        # Recursively build the left and right subtrees
-        self.__build_balanced_tree(elements[:mid])  # Left subtree
-        self.__build_balanced_tree(elements[mid+1:])  # Right subtree
-
-
-def in_order_traversal(node):
-    """Helper function to perform in-order traversal of the tree."""
-    if node is None:
-        return []
-    return in_order_traversal(node.left) + [(node.key, node.item)] + in_order_traversal(node.right)
-
-# Testing the BetterBST with an example
-elements = [(5, 'five'), (3, 'three'), (8, 'eight'), (1, 'one'), (4, 'four'), (7, 'seven'), (10, 'ten')]
-bst = BetterBST(elements)
-
-# Performing in-order traversal to check if the tree is balanced
-sorted_elements = in_order_traversal(bst.root)
-print("In-order traversal of the balanced BST:", sorted_elements)
+        for i in range(1, len(elements)):
+            if elements[i][0] == elements[i - 1][0]:
+                raise ValueError('Inserting duplicate item')
+        self.root = self.link_sorted_aux(elements, 0, len(elements), 1)
+        self.length = len(elements)
+
+
+if __name__ == "__main__":
+    def in_order_traversal(node):
+        """Helper function to perform in-order traversal of the tree."""
+        if node is None:
+            return []
+        return in_order_traversal(node.left) + [(node.key, node.item)] + in_order_traversal(node.right)
+
+    # Testing the BetterBST with an example
+    elements = [(5, 'five'), (3, 'three'), (8, 'eight'), (1, 'one'), (4, 'four'), (7, 'seven'), (10, 'ten')]
+    bst = BetterBST(elements)
+
+    # Performing in-order traversal to check if the tree is balanced
+    sorted_elements = in_order_traversal(bst.root)
+    print("In-order traversal of the balanced BST:", sorted_elements)
@@ -0,0 +1,112 @@
+""" Stack ADT based on a growing array. """
+
+__docformat__ = 'reStructuredText'
+
+from typing import Iterable, List
+
+from data_structures.stack_adt import *
+
+
+class ArrayStack(Stack[T]):
+    """ Implementation of a stack with an array that doubles when full.
+        Pushing stores a reference in a free slot, so no object is allocated per element.
+        The slots are a list used as a fixed-length array that only ever grows by doubling;
+        unlike ArrayR, indexing it does not go through a Python-level method call.
+
+        Attributes:
+            length (int): number of elements in the stack (inherited)
+            array (List[T]): the elements, bottom first, with spare slots after them
+    """
+
+    MIN_CAPACITY = 8
+
+    __slots__ = ('array',)
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY) -> None:
+        """ Object initializer, max_capacity is only the initial number of slots.
+            :complexity: O(max_capacity)
+        """
+        Stack.__init__(self)
+        self.array: List[T] = [None] * max(self.MIN_CAPACITY, max_capacity)
+
+    def clear(self) -> None:
+        """ Resets the stack, dropping the references it holds.
+            :complexity: O(1) amortised, as each slot cleared was filled by a push
+        """
+        if self.length:
+            self.array[0:self.length] = [None] * self.length
+        super().clear()
+
+    def is_full(self) -> bool:
+        """ Returns whether the stack is full, which it never is as it grows.
+            :complexity: O(1)
+        """
+        return False
+
+    def ensure_capacity(self, capacity: int) -> None:
+        """ Grows the array, at least doubling it, if it has fewer than capacity slots.
+            :complexity: O(capacity) when it grows, O(1) otherwise
+        """
+        if capacity > len(self.array):
+            self.array.extend([None] * (max(capacity, 2 * len(self.array)) - len(self.array)))
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack.
+            :complexity: O(1) amortised
+        """
+        array = self.array
+        if self.length == len(array):
+            array.extend([None] * self.length)
+        array[self.length] = item
+        self.length += 1
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """ Pushes the elements in order, so the last one ends up on top.
+            :complexity: O(k) where k is the number of elements
+        """
+        items = list(items)
+        end = self.length + len(items)
+        self.ensure_capacity(end)
+        self.array[self.length:end] = items
+        self.length = end
+
+    def pop(self) -> T:
+        """ Pops the element at the top of the stack.
+            :pre: stack is not empty
+            :complexity: O(1)
+            :raises Exception: if the stack is empty
+        """
+        if self.length == 0:
+            raise Exception('Stack is empty')
+        self.length -= 1
+        array = self.array
+        item = array[self.length]
+        array[self.length] = None
+        return item
+
+    def pop_many(self, count: int) -> List[T]:
+        """ Pops count elements and returns them in the order pop would, top first.
+            :pre: 0 <= count and the stack holds at least count elements
+            :complexity: O(count)
+            :raises Exception: if count is negative or the stack holds fewer than count elements
+        """
+        if count < 0:
+            raise Exception('Cannot pop {0} elements'.format(count))
+        if count > self.length:
+            raise Exception('Stack has fewer than {0} elements'.format(count))
+        start = self.length - count
+        items = self.array[start:self.length]
+        self.array[start:self.length] = [None] * count
+        self.length = start
+        items.reverse()
+        return items
+
+    def peek(self) -> T:
+        """ Returns the element at the top, without popping it from stack.
+            :pre: stack is not empty
+            :complexity: O(1)
+            :raises Exception: if the stack is empty
+        """
+        if self.length == 0:
+            raise Exception('Stack is empty')
+        return self.array[self.length - 1]
@@ -0,0 +1,198 @@
+""" AVL tree ADT.
+    A self-balancing Binary Search Tree: after every insertion and deletion
+    the heights of the two sub-trees of any node differ by at most one,
+    which keeps the height of the tree below 1.44 * log2(n + 2).
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar
+
+from data_structures.bst import BinarySearchTree
+from data_structures.node import TreeNode
+
+# generic types
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class AVLTree(BinarySearchTree[K, I]):
+    """ Binary search tree that rebalances itself with rotations.
+        Heights are kept up to date as in the plain tree. The depth field is only
+        correct when the node is inserted, as rotations move whole sub-trees.
+    """
+
+    def get_balance(self, current: TreeNode) -> int:
+        """ Height of the left sub-tree minus that of the right one.
+            :complexity: O(1)
+        """
+        return self.get_height(current.left) - self.get_height(current.right)
+
+    def rotate_left(self, current: TreeNode) -> TreeNode:
+        """ Makes the right child the root of this sub-tree and returns it.
+            :complexity: O(1)
+        """
+        new_root = current.right
+        current.right = new_root.left
+        new_root.left = current
+        self.refresh(current)
+        self.refresh(new_root)
+        return new_root
+
+    def rotate_right(self, current: TreeNode) -> TreeNode:
+        """ Makes the left child the root of this sub-tree and returns it.
+            :complexity: O(1)
+        """
+        new_root = current.left
+        current.left = new_root.right
+        new_root.right = current
+        self.refresh(current)
+        self.refresh(new_root)
+        return new_root
+
+    def rebalance(self, current: TreeNode) -> TreeNode:
+        """ Restores the AVL property at a node whose sub-trees are AVL trees
+            with heights differing by at most two, and returns the new sub-tree root.
+            :complexity: O(1)
+        """
+        self.refresh(current)
+        left, right = current.left, current.right
+        balance = (0 if left is None else left.height) - (0 if right is None else right.height)
+        if balance > 1:
+            if self.get_balance(current.left) < 0:
+                current.left = self.rotate_left(current.left)
+            return self.rotate_right(current)
+        if balance < -1:
+            if self.get_balance(current.right) > 0:
+                current.right = self.rotate_right(current.right)
+            return self.rotate_left(current)
+        return current
+
+    def insert_aux(self, current: TreeNode, key: K, item: I, current_depth: int) -> TreeNode:
+        """
+            Inserts the item and rebalances every node on the way back up.
+            The recursion is only as deep as the tree, which is O(log n).
+            :complexity: O(CompK * log n)
+            :raises ValueError: if the key is already in the tree
+        """
+        if current is None:
+            self.length += 1
+            return TreeNode(key, item, current_depth)
+        if key < current.key:
+            current.left = self.insert_aux(current.left, key, item, current_depth + 1)
+        elif key > current.key:
+            current.right = self.insert_aux(current.right, key, item, current_depth + 1)
+        else:
+            raise ValueError('Inserting duplicate item')
+        return self.rebalance(current)
+
+    def delete_aux(self, current: TreeNode, key: K) -> TreeNode:
+        """
+            Deletes the item and rebalances every node on the way back up.
+            :complexity: O(CompK * log n)
+            :raises ValueError: if the key is not in the tree
+        """
+        if current is None:
+            raise ValueError('Deleting non-existent item')
+        if key < current.key:
+            current.left = self.delete_aux(current.left, key)
+        elif key > current.key:
+            current.right = self.delete_aux(current.right, key)
+        elif current.left is None or current.right is None:
+            self.length -= 1
+            return current.left if current.left is not None else current.right
+        else:
+            succ = self.get_successor(current)
+            current.key = succ.key
+            current.item = succ.item
+            current.right = self.delete_aux(current.right, succ.key)
+        return self.rebalance(current)
+
+    def join_aux(self, left: TreeNode | None, middle: TreeNode, right: TreeNode | None) -> TreeNode:
+        """ Joins two AVL sub-trees around a middle node whose key lies between theirs.
+            The shorter tree is hung off the spine of the taller one at a matching height
+            and every node above it is rebalanced.
+            :complexity: O(|height(left) - height(right)| + 1)
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if left_height > right_height + 1:
+            left.right = self.join_aux(left.right, middle, right)
+            return self.rebalance(left)
+        if right_height > left_height + 1:
+            right.left = self.join_aux(left, middle, right.left)
+            return self.rebalance(right)
+        middle.left, middle.right = left, right
+        self.refresh(middle)
+        return middle
+
+    def split_aux(self, current: TreeNode | None, key: K) -> tuple[TreeNode | None, TreeNode | None]:
+        """ Splits a sub-tree into the AVL trees of keys < key and keys >= key.
+            The joins along the search path telescope to O(log n) in total.
+            :complexity: O(CompK * log n)
+        """
+        if current is None:
+            return None, None
+        left, right = current.left, current.right
+        if current.key < key:
+            lower, upper = self.split_aux(right, key)
+            return self.join_aux(left, current, lower), upper
+        lower, upper = self.split_aux(left, key)
+        return lower, self.join_aux(upper, current, right)
+
+    def split(self, key: K) -> AVLTree[K, I]:
+        """ Moves every pair with a key >= key into a new AVL tree, which is returned.
+            Both trees stay balanced, but the depth field of moved nodes is left stale.
+            :complexity: O(CompK * log n)
+        """
+        self.shape_stats = None
+        upper = type(self)()
+        self.root, upper.root = self.split_aux(self.root, key)
+        upper.length = self.get_size(upper.root)
+        self.length -= upper.length
+        return upper
+
+    def join(self, other: AVLTree[K, I]) -> None:
+        """ Moves every pair of other, whose keys must all be greater than those of
+            this tree, into this tree and leaves other empty.
+            The minimal node of other is unlinked and used as the middle node of the join.
+            :complexity: O(CompK * log n)
+            :raises ValueError: if a key of other is not greater than every key of this tree
+        """
+        if other.root is None:
+            return
+        middle = self.get_minimal(other.root)
+        if self.root is not None and not self.get_maximal(self.root).key < middle.key:
+            raise ValueError('Joined keys must be greater than every key in the tree')
+        self.shape_stats = other.shape_stats = None
+        length = self.length + other.length
+        other.root = other.delete_aux(other.root, middle.key)
+        self.root = self.join_aux(self.root, TreeNode(middle.key, middle.item), other.root)
+        self.length = length
+        other.root = None
+        other.length = 0
+
+    def get_tree_height(self) -> int:
+        """ Number of nodes on the longest root to leaf path.
+            :complexity: O(1)
+        """
+        return self.get_height(self.root)
+
+    def is_balanced(self) -> bool:
+        """ Checks the AVL property, which insertions and deletions maintain,
+            by recomputing every height from scratch.
+            :complexity: O(n)
+        """
+        return self.check_avl_aux(self.root) >= 0
+
+    def check_avl_aux(self, current: TreeNode | None) -> int:
+        """ Returns the height of the sub-tree, or -1 if it is not an AVL tree.
+            The recursion is only as deep as the tree.
+        """
+        if current is None:
+            return 0
+        left, right = self.check_avl_aux(current.left), self.check_avl_aux(current.right)
+        if left < 0 or right < 0 or abs(left - right) > 1 or current.height != 1 + max(left, right):
+            return -1
+        return current.height
@@ -8,12 +8,12 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor, modified by Alexey Ignatiev, further modified by Jackson Goerner'
 __docformat__ = 'reStructuredText'
 
-import math
 import sys
-from typing import Generic, TypeVar
+from dataclasses import dataclass
+from typing import Generic, Iterator, TypeVar
 
-from data_structures.linked_stack import LinkedStack
 from data_structures.node import TreeNode
+from data_structures.stack_adt import Stack
 
 # generic types
 K = TypeVar('K')
@@ -21,16 +21,106 @@ I = TypeVar('I')
 T = TypeVar('T')
 
 
+def traversal_stack(stack: Stack[TreeNode[K, I]] | None) -> tuple:
+    """ Returns the container, push and pop of the stack a traversal runs on.
+        Without a stack this is a fresh list; a given stack is cleared first, so one
+        ArrayStack can be reused by many traversals without allocating anything.
+        Both are truthy exactly when they hold nodes.
+        :complexity: O(1) amortised
+    """
+    if stack is None:
+        stack = []
+        return stack, stack.append, stack.pop
+    stack.clear()
+    return stack, stack.push, stack.pop
+
+
+def pre_order(root: TreeNode[K, I] | None, stack: Stack[TreeNode[K, I]] | None = None) -> Iterator[TreeNode[K, I]]:
+    """ Yields the nodes of a sub-tree in pre-order.
+        The stack holds the nodes themselves, so nothing is allocated per node.
+        :complexity: O(n) in total, O(D) extra space where D is the depth of the sub-tree
+    """
+    stack, push, pop = traversal_stack(stack)
+    if root is None:
+        return
+    push(root)
+    while stack:
+        current = pop()
+        yield current
+        if current.right is not None:
+            push(current.right)
+        if current.left is not None:
+            push(current.left)
+
+
+def in_order(root: TreeNode[K, I] | None, stack: Stack[TreeNode[K, I]] | None = None) -> Iterator[TreeNode[K, I]]:
+    """ Yields the nodes of a sub-tree in in-order, that is by increasing key.
+        :complexity: O(n) in total, O(D) extra space where D is the depth of the sub-tree
+    """
+    stack, push, pop = traversal_stack(stack)
+    current = root
+    while True:
+        while current is not None:
+            push(current)
+            current = current.left
+        if not stack:
+            return
+        current = pop()
+        yield current
+        current = current.right
+
+
+def reverse_in_order(root: TreeNode[K, I] | None, stack: Stack[TreeNode[K, I]] | None = None) -> Iterator[TreeNode[K, I]]:
+    """ Yields the nodes of a sub-tree by decreasing key.
+        :complexity: O(n) in total, O(D) extra space where D is the depth of the sub-tree
+    """
+    stack, push, pop = traversal_stack(stack)
+    current = root
+    while True:
+        while current is not None:
+            push(current)
+            current = current.right
+        if not stack:
+            return
+        current = pop()
+        yield current
+        current = current.left
+
+
+def post_order(root: TreeNode[K, I] | None, stack: Stack[TreeNode[K, I]] | None = None) -> Iterator[TreeNode[K, I]]:
+    """ Yields the nodes of a sub-tree in post-order.
+        Instead of marking nodes as expanded, a node on top of the stack is
+        yielded once its right child is missing or was the last node yielded,
+        and pushed back otherwise.
+        :complexity: O(n) in total, O(D) extra space where D is the depth of the sub-tree
+    """
+    stack, push, pop = traversal_stack(stack)
+    last = None
+    current = root
+    while True:
+        while current is not None:
+            push(current)
+            current = current.left
+        if not stack:
+            return
+        top = pop()
+        if top.right is not None and top.right is not last:
+            push(top)
+            current = top.right
+        else:
+            last = top
+            yield top
+
+
 class BSTPreOrderIterator:
     """ Pre-order iterator for the binary search tree.
-        Performs stack-based BST traversal.
+        Wraps the pre_order generator.
     """
 
-    def __init__(self, root: TreeNode[K, I]) -> None:
-        """ Iterator initialiser. """
+    def __init__(self, root: TreeNode[K, I], stack: Stack[TreeNode[K, I]] | None = None) -> None:
+        """ Iterator initialiser, traversing on the given stack, such as a reused ArrayStack, if any. """
 
-        self.stack = LinkedStack()
-        self.stack.push(root)
+        self.nodes = pre_order(root, stack)
 
     def __iter__(self) -> BSTPreOrderIterator:
         """ Standard __iter__() method for initialisers. Returns itself. """
@@ -42,26 +132,18 @@ class BSTPreOrderIterator:
             Returns keys of the BST one by one respecting the pre-order.
         """
 
-        if self.stack.is_empty():
-            raise StopIteration
-        current = self.stack.pop()
-        if current.right:
-            self.stack.push(current.right)
-        if current.left:
-            self.stack.push(current.left)
-        return current
+        return next(self.nodes)
 
 
 class BSTInOrderIterator:
     """ In-order iterator for the binary search tree.
-        Performs stack-based BST traversal.
+        Wraps the in_order generator.
     """
 
-    def __init__(self, root: TreeNode[K, I]) -> None:
-        """ Iterator initialiser. """
+    def __init__(self, root: TreeNode[K, I], stack: Stack[TreeNode[K, I]] | None = None) -> None:
+        """ Iterator initialiser, traversing on the given stack, such as a reused ArrayStack, if any. """
 
-        self.stack = LinkedStack()
-        self.current = root
+        self.nodes = in_order(root, stack)
 
     def __iter__(self) -> BSTInOrderIterator:
         """ Standard __iter__() method for initialisers. Returns itself. """
@@ -73,29 +155,18 @@ class BSTInOrderIterator:
             Returns keys of the BST one by one respecting the in-order.
         """
 
-        while self.current:
-            self.stack.push(self.current)
-            self.current = self.current.left
-
-        if self.stack.is_empty():
-            raise StopIteration
-
-        result = self.stack.pop()
-        self.current = result.right
-
-        return result
+        return next(self.nodes)
 
 
 class BSTPostOrderIterator:
     """ Post-order iterator for the binary search tree.
-        Performs stack-based BST traversal.
+        Wraps the post_order generator.
     """
 
-    def __init__(self, root: TreeNode[K, I]) -> None:
-        """ Iterator initialiser. """
+    def __init__(self, root: TreeNode[K, I], stack: Stack[TreeNode[K, I]] | None = None) -> None:
+        """ Iterator initialiser, traversing on the given stack, such as a reused ArrayStack, if any. """
 
-        self.stack = LinkedStack()
-        self.stack.push((root, False))
+        self.nodes = post_order(root, stack)
 
     def __iter__(self) -> BSTPostOrderIterator:
         """ Standard __iter__() method for initialisers. Returns itself. """
@@ -106,18 +177,17 @@ class BSTPostOrderIterator:
             Returns keys of the BST one by one respecting the post-order.
         """
 
-        while True:
-            if self.stack.is_empty():
-                raise StopIteration
-            current, expanded = self.stack.pop()
-            if expanded:
-                return current
-            else:
-                self.stack.push((current, True))
-                if current.right:
-                    self.stack.push((current.right, False))
-                if current.left:
-                    self.stack.push((current.left, False))
+        return next(self.nodes)
+
+
+@dataclass(frozen=True)
+class TreeStats:
+    """ Shape of a binary search tree, see BinarySearchTree.stats. """
+    height: int
+    leaves: int
+    average_depth: float
+    max_depth: int
+    imbalance_ratio: float  # height over the smallest possible height for the size
 
 
 class BinarySearchTree(Generic[K, I]):
@@ -131,6 +201,7 @@ class BinarySearchTree(Generic[K, I]):
 
         self.root = None
         self.length = 0
+        self.shape_stats = None
 
     def is_empty(self) -> bool:
         """
@@ -156,9 +227,13 @@ class BinarySearchTree(Generic[K, I]):
         else:
             return True
 
-    def __iter__(self) -> BSTInOrderIterator:
-        """ Create an in-order iterator. """
-        return BSTInOrderIterator(self.root)
+    def __iter__(self) -> Iterator[TreeNode[K, I]]:
+        """ Iterates over the nodes by increasing key. """
+        return in_order(self.root)
+
+    def __reversed__(self) -> Iterator[TreeNode[K, I]]:
+        """ Iterates over the nodes by decreasing key. """
+        return reverse_in_order(self.root)
 
     def __getitem__(self, key: K) -> I:
         """
@@ -173,16 +248,20 @@ class BinarySearchTree(Generic[K, I]):
         return self.get_tree_node_by_key_aux(self.root, key)
 
     def get_tree_node_by_key_aux(self, current: TreeNode, key: K) -> TreeNode:
-        if current is None:  # base case: empty
-            raise KeyError('Key not found: {0}'.format(key))
-        elif key == current.key:  # base case: found
-            return current
-        elif key < current.key:
-            return self.get_tree_node_by_key_aux(current.left, key)
-        else:  # key > current.key
-            return self.get_tree_node_by_key_aux(current.right, key)
+        """
+            Walks down from current to the node with the given key
+            :complexity best: O(CompK) finds the item in the root of the tree
+            :complexity worst: O(CompK * D) item is not found, where D is the depth of the tree
+            :raises KeyError: if the key is not in the sub-tree
+        """
+        while current is not None:
+            if key == current.key:
+                return current
+            current = current.left if key < current.key else current.right
+        raise KeyError('Key not found: {0}'.format(key))
 
     def __setitem__(self, key: K, item: I) -> None:
+        self.shape_stats = None
         self.root = self.insert_aux(self.root, key, item, 1)
 
     def insert_aux(self, current: TreeNode, key: K, item: I, current_depth: int) -> TreeNode:
@@ -192,50 +271,82 @@ class BinarySearchTree(Generic[K, I]):
             :complexity worst: O(CompK * D) inserting at the bottom of the tree
             where D is the depth of the tree
             CompK is the complexity of comparing the keys
+            Every node passed gains one in size, which is undone if the key is a duplicate,
+            and their heights are refreshed bottom-up once the new node is linked.
         """
-        if current is None:  # base case: at the leaf
-            current = TreeNode(key, item, current_depth)
+        new_node = TreeNode(key, item, current_depth)
+        if current is None:  # empty sub-tree: the new node is its root
             self.length += 1
-        elif key < current.key:
-            current.left = self.insert_aux(current.left, key, item, current_depth + 1)
-        elif key > current.key:
-            current.right = self.insert_aux(current.right, key, item, current_depth + 1)
-        else:  # key == current.key
-            raise ValueError('Inserting duplicate item')
+            return new_node
+
+        node = current
+        path = []
+        while True:
+            path.append(node)
+            new_node.depth += 1
+            node.size += 1
+            if key < node.key:
+                if node.left is None:
+                    node.left = new_node
+                    break
+                node = node.left
+            elif key > node.key:
+                if node.right is None:
+                    node.right = new_node
+                    break
+                node = node.right
+            else:  # key == node.key
+                for passed in path:
+                    passed.size -= 1
+                raise ValueError('Inserting duplicate item')
+        self.refresh_heights(path)
+        self.length += 1
         return current
 
     def __delitem__(self, key: K) -> None:
+        self.shape_stats = None
         self.root = self.delete_aux(self.root, key)
 
     def delete_aux(self, current: TreeNode, key: K) -> TreeNode:
         """
             Attempts to delete an item from the tree, it uses the Key to
             determine the node to delete.
+            Returns the root of the sub-tree after the deletion.
+            :complexity best: O(CompK) deleting a root with at most one child
+            :complexity worst: O(CompK * D) where D is the depth of the tree
+            :raises ValueError: if the key is not in the sub-tree
         """
-
-        if current is None:  # key not found
+        parent, node = None, current
+        ancestors = []
+        while node is not None and key != node.key:
+            ancestors.append(node)
+            parent, node = node, (node.left if key < node.key else node.right)
+        if node is None:  # key not found
             raise ValueError('Deleting non-existent item')
-        elif key < current.key:
-            current.left = self.delete_aux(current.left, key)
-        elif key > current.key:
-            current.right = self.delete_aux(current.right, key)
-        else:  # we found our key => do actual deletion
-            if self.is_leaf(current):
-                self.length -= 1
-                return None
-            elif current.left is None:
-                self.length -= 1
-                return current.right
-            elif current.right is None:
-                self.length -= 1
-                return current.left
-
-            # general case => find a successor
-            succ = self.get_successor(current)
-            current.key = succ.key
-            current.item = succ.item
-            current.right = self.delete_aux(current.right, succ.key)
 
+        if node.left is not None and node.right is not None:
+            # general case => copy the successor up, then unlink the successor instead
+            ancestors.append(node)
+            parent, succ = node, node.right
+            while succ.left is not None:
+                ancestors.append(succ)
+                parent, succ = succ, succ.left
+            node.key = succ.key
+            node.item = succ.item
+            node = succ
+
+        # node has at most one child, which takes its place
+        for ancestor in ancestors:
+            ancestor.size -= 1
+        child = node.left if node.left is not None else node.right
+        self.length -= 1
+        if parent is None:
+            return child
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self.refresh_heights(ancestors)
         return current
 
     def get_successor(self, current: TreeNode) -> TreeNode:
@@ -255,9 +366,9 @@ class BinarySearchTree(Generic[K, I]):
         """
         if current is None:
             return None
-        if current.left is None:
-            return current
-        return self.get_minimal(current.left)
+        while current.left is not None:
+            current = current.left
+        return current
 
     def get_maximal(self, current: TreeNode) -> TreeNode | None:
         """
@@ -265,9 +376,303 @@ class BinarySearchTree(Generic[K, I]):
         """
         if current is None:
             return None
-        if current.right is None:
-            return current
-        return self.get_maximal(current.right)
+        while current.right is not None:
+            current = current.right
+        return current
+
+    @staticmethod
+    def get_size(current: TreeNode | None) -> int:
+        """ Number of nodes in a sub-tree, 0 for an empty one.
+            :complexity: O(1)
+        """
+        return 0 if current is None else current.size
+
+    @staticmethod
+    def get_height(current: TreeNode | None) -> int:
+        """ Number of nodes on the longest path from a node down to a leaf, 0 for an empty sub-tree.
+            :complexity: O(1)
+        """
+        return 0 if current is None else current.height
+
+    def refresh(self, current: TreeNode) -> None:
+        """ Recomputes the height, shortest leaf path and size of a node from its children.
+            :complexity: O(1)
+        """
+        left, right = current.left, current.right
+        if left is None and right is None:
+            current.height = current.min_height = current.size = 1
+        elif left is None or right is None:
+            child = left if right is None else right
+            current.height = 1 + child.height
+            current.min_height = 1 + child.min_height
+            current.size = 1 + child.size
+        else:
+            current.height = 1 + (left.height if left.height > right.height else right.height)
+            current.min_height = 1 + (left.min_height if left.min_height < right.min_height else right.min_height)
+            current.size = 1 + left.size + right.size
+
+    @staticmethod
+    def refresh_heights(path: list[TreeNode]) -> None:
+        """ Recomputes the heights and shortest leaf paths along a root-to-leaf path
+            below which one sub-tree changed, deepest first. Once a node is unchanged
+            so are all of its ancestors, which ends the walk early.
+            :complexity best: O(1)
+            :complexity worst: O(len(path))
+        """
+        for i in range(len(path) - 1, -1, -1):
+            current = path[i]
+            left, right = current.left, current.right
+            if left is None and right is None:
+                height = min_height = 1
+            elif left is None or right is None:
+                child = left if right is None else right
+                height, min_height = 1 + child.height, 1 + child.min_height
+            else:
+                height = 1 + (left.height if left.height > right.height else right.height)
+                min_height = 1 + (left.min_height if left.min_height < right.min_height else right.min_height)
+            if height == current.height and min_height == current.min_height:
+                return
+            current.height, current.min_height = height, min_height
+
+    def refresh_path(self, path: list[TreeNode]) -> None:
+        """ Refreshes the nodes of a root-to-leaf path, deepest first.
+            :complexity: O(len(path))
+        """
+        for i in range(len(path) - 1, -1, -1):
+            self.refresh(path[i])
+
+    def kth(self, k: int) -> TreeNode:
+        """
+            Returns the node with the k-th smallest key, counting from 1.
+            :complexity: O(D) where D is the depth of the tree
+            :raises IndexError: if k is not between 1 and len(self)
+        """
+        if not 1 <= k <= self.length:
+            raise IndexError('No {0}-th key in a tree of {1}'.format(k, self.length))
+        current = self.root
+        while True:
+            left_size = self.get_size(current.left)
+            if k <= left_size:
+                current = current.left
+            elif k == left_size + 1:
+                return current
+            else:
+                k -= left_size + 1
+                current = current.right
+
+    def rank(self, key: K) -> int:
+        """
+            Returns the number of keys in the tree smaller than key, which need not be in the tree.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        smaller = 0
+        current = self.root
+        while current is not None:
+            if key <= current.key:
+                current = current.left
+            else:
+                smaller += self.get_size(current.left) + 1
+                current = current.right
+        return smaller
+
+    def count_range(self, lo: K, hi: K) -> int:
+        """
+            Returns the number of keys with lo <= key < hi.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        if not lo < hi:
+            return 0
+        return self.rank(hi) - self.rank(lo)
+
+    def floor(self, key: K) -> TreeNode | None:
+        """
+            Returns the node with the largest key <= key, or None if every key is larger.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        best = None
+        current = self.root
+        while current is not None:
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                best = current
+                current = current.right
+            else:
+                return current
+        return best
+
+    def ceiling(self, key: K) -> TreeNode | None:
+        """
+            Returns the node with the smallest key >= key, or None if every key is smaller.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        best = None
+        current = self.root
+        while current is not None:
+            if key > current.key:
+                current = current.right
+            elif key < current.key:
+                best = current
+                current = current.left
+            else:
+                return current
+        return best
+
+    def range_items(self, lo: K, hi: K):
+        """
+            Lazily yields the (key, item) pairs with lo <= key < hi in key order.
+            Only the ancestors of the next node are kept, and sub-trees outside
+            the range are never entered.
+            :complexity: O(CompK * (D + k)) where D is the depth of the tree and k the number of pairs yielded
+        """
+        stack = []
+        current = self.root
+        while True:
+            while current is not None:  # walk down to the smallest key >= lo
+                if current.key < lo:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if not current.key < hi:
+                return
+            yield current.key, current.item
+            current = current.right
+
+    @classmethod
+    def from_sorted(cls, elements: list[tuple[K, I]]) -> BinarySearchTree[K, I]:
+        """
+            Builds a balanced tree from (key, item) pairs sorted by strictly increasing key.
+            :complexity: O(CompK * n) where n is the number of pairs
+            :raises ValueError: if two keys are equal or out of order
+        """
+        for i in range(1, len(elements)):
+            if not elements[i - 1][0] < elements[i][0]:
+                if elements[i - 1][0] == elements[i][0]:
+                    raise ValueError('Inserting duplicate item')
+                raise ValueError('Elements are not sorted by key')
+        tree = cls()
+        tree.root = tree.link_sorted_aux(elements, 0, len(elements), 1)
+        tree.length = len(elements)
+        return tree
+
+    def link_sorted_aux(self, elements: list[tuple[K, I]], lo: int, hi: int, depth: int) -> TreeNode | None:
+        """
+            Links the balanced sub-tree holding the sorted elements[lo:hi], with its root at the given depth.
+            The middle element of the range becomes the root of the range.
+            :complexity: O(hi - lo)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        key, item = elements[mid]
+        node = TreeNode(key, item, depth)
+        node.left = self.link_sorted_aux(elements, lo, mid, depth + 1)
+        node.right = self.link_sorted_aux(elements, mid + 1, hi, depth + 1)
+        self.refresh(node)
+        return node
+
+    @classmethod
+    def merge(cls, first: BinarySearchTree[K, I], second: BinarySearchTree[K, I]) -> BinarySearchTree[K, I]:
+        """
+            Builds a new balanced tree holding the pairs of both trees, which are left unchanged.
+            The two in-order streams are merged and linked in one pass.
+            :complexity: O(CompK * (n + m)) where n and m are the sizes of the trees
+            :raises ValueError: if a key is in both trees
+        """
+        elements = []
+        left, right = iter(first), iter(second)
+        a, b = next(left, None), next(right, None)
+        while a is not None and b is not None:
+            if a.key < b.key:
+                elements.append((a.key, a.item))
+                a = next(left, None)
+            elif b.key < a.key:
+                elements.append((b.key, b.item))
+                b = next(right, None)
+            else:
+                raise ValueError('Inserting duplicate item')
+        while a is not None:
+            elements.append((a.key, a.item))
+            a = next(left, None)
+        while b is not None:
+            elements.append((b.key, b.item))
+            b = next(right, None)
+        return cls.from_sorted(elements)
+
+    def split(self, key: K) -> BinarySearchTree[K, I]:
+        """
+            Moves every pair with a key >= key into a new tree, which is returned.
+            Only the nodes on the search path for key are relinked, and the depth
+            field of moved nodes is left stale.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        self.shape_stats = None
+        upper = type(self)()
+        lower_root = lower_tail = upper_tail = None
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            if current.key < key:  # current and its left sub-tree stay
+                if lower_tail is None:
+                    lower_root = current
+                else:
+                    lower_tail.right = current
+                lower_tail, current = current, current.right
+            else:  # current and its right sub-tree move
+                if upper_tail is None:
+                    upper.root = current
+                else:
+                    upper_tail.left = current
+                upper_tail, current = current, current.left
+        if lower_tail is not None:
+            lower_tail.right = None
+        if upper_tail is not None:
+            upper_tail.left = None
+        self.refresh_path(path)  # children on the path are fixed before their parents
+        self.root = lower_root
+        upper.length = self.get_size(upper.root)
+        self.length -= upper.length
+        return upper
+
+    def join(self, other: BinarySearchTree[K, I]) -> None:
+        """
+            Moves every pair of other, whose keys must all be greater than those of
+            this tree, into this tree and leaves other empty.
+            The maximal node of this tree becomes the new root, and the depth
+            field of moved nodes is left stale.
+            :complexity: O(CompK * (D1 + D2)) where D1 and D2 are the depths of the trees
+            :raises ValueError: if a key of other is not greater than every key of this tree
+        """
+        if other.root is None:
+            return
+        self.shape_stats = None
+        if self.root is not None:
+            if not self.get_maximal(self.root).key < self.get_minimal(other.root).key:
+                raise ValueError('Joined keys must be greater than every key in the tree')
+            parent, top = None, self.root
+            spine = []
+            while top.right is not None:
+                spine.append(top)
+                parent, top = top, top.right
+            if parent is None:
+                self.root = top.left
+            else:
+                parent.right = top.left
+            self.refresh_path(spine)
+            top.left, top.right = self.root, other.root
+            self.refresh(top)
+            self.root = top
+        else:
+            self.root = other.root
+        self.length += other.length
+        other.root = None
+        other.length = 0
+        other.shape_stats = None
 
     def is_leaf(self, current: TreeNode) -> bool:
         """ Simple check whether or not the node is a leaf. """
@@ -275,16 +680,50 @@ class BinarySearchTree(Generic[K, I]):
         return current.left is None and current.right is None
 
     def is_balanced(self) -> bool:
-        target_depth: int = math.ceil(math.log(len(self), 2))
-        return self.get_depth_aux(self.root, target_depth)
-
-    def get_depth_aux(self, current: TreeNode, target_depth: int) -> bool:
-        if current is None:
+        """
+            Checks that every leaf is within one level of depth ceil(log2 n), which is the
+            case for a tree built from sorted elements. The deepest and shallowest leaves
+            are the maintained height and shortest leaf path of the root.
+            :complexity: O(1)
+        """
+        if self.root is None:
             return True
-        if self.is_leaf(current):
-            cond = target_depth - 1 <= current.depth <= target_depth + 1
-            return cond
-        return self.get_depth_aux(current.left, target_depth) and self.get_depth_aux(current.right, target_depth)
+        target_depth = (self.length - 1).bit_length()  # ceil(log2 n)
+        return target_depth - 1 <= self.root.min_height and self.root.height <= target_depth + 1
+
+    def stats(self) -> TreeStats:
+        """
+            Reports the shape of the tree, with depths counted in nodes from the root.
+            The height is maintained, while the leaf count and average depth take one
+            iterative pass, whose result is cached until the tree changes.
+            :complexity best: O(1) when the tree has not changed since the last call
+            :complexity worst: O(n)
+        """
+        if self.shape_stats is None:
+            leaves = depth_sum = 0
+            nodes, depths = [], []
+            if self.root is not None:
+                nodes.append(self.root)
+                depths.append(1)
+            while nodes:
+                current, depth = nodes.pop(), depths.pop()
+                depth_sum += depth
+                if current.left is None and current.right is None:
+                    leaves += 1
+                for child in (current.left, current.right):
+                    if child is not None:
+                        nodes.append(child)
+                        depths.append(depth + 1)
+            height = self.get_height(self.root)
+            optimal = self.length.bit_length()  # ceil(log2(n + 1))
+            self.shape_stats = TreeStats(
+                height=height,
+                leaves=leaves,
+                average_depth=depth_sum / self.length if self.length else 0.0,
+                max_depth=height,
+                imbalance_ratio=height / optimal if optimal else 1.0,
+            )
+        return self.shape_stats
 
     def draw(self, to=sys.stdout):
         """ Draw the tree in the terminal. """
@@ -0,0 +1,140 @@
+""" Read-only binary search tree stored in Eytzinger (breadth-first) order.
+    Node k has its children at 2k and 2k + 1, so a search walks down a single
+    contiguous array of keys instead of chasing node references.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, Iterator, List, Tuple, TypeVar
+
+from data_structures.bst import BinarySearchTree
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class FrozenBST(Generic[K, I]):
+    """ Immutable search tree over sorted (key, item) pairs.
+        Keys and items live in parallel arrays indexed from 1, slot 0 being unused,
+        and every query is a loop over indices that allocates nothing.
+    """
+
+    def __init__(self, elements: List[Tuple[K, I]]) -> None:
+        """
+            Lays out (key, item) pairs sorted by strictly increasing key.
+            :complexity: O(CompK * n) where n is the number of pairs
+            :raises ValueError: if two keys are equal or out of order
+        """
+        for i in range(1, len(elements)):
+            if not elements[i - 1][0] < elements[i][0]:
+                if elements[i - 1][0] == elements[i][0]:
+                    raise ValueError('Inserting duplicate item')
+                raise ValueError('Elements are not sorted by key')
+        self.length = len(elements)
+        self.keys: List[K] = [None] * (self.length + 1)
+        self.items: List[I] = [None] * (self.length + 1)
+        self.fill_aux(elements, 1, 0)
+
+    @classmethod
+    def from_tree(cls, tree: BinarySearchTree[K, I]) -> FrozenBST[K, I]:
+        """
+            Freezes the pairs of a tree, such as a BetterBST, which is left unchanged.
+            :complexity: O(n)
+        """
+        return cls([(node.key, node.item) for node in tree])
+
+    def fill_aux(self, elements: List[Tuple[K, I]], k: int, i: int) -> int:
+        """
+            Places elements[i:] at the slots of the sub-tree rooted at slot k in in-order,
+            and returns the index of the first element left unplaced.
+            The recursion is only as deep as the tree, which is O(log n).
+            :complexity: O(size of the sub-tree)
+        """
+        if k > self.length:
+            return i
+        i = self.fill_aux(elements, 2 * k, i)
+        self.keys[k], self.items[k] = elements[i]
+        return self.fill_aux(elements, 2 * k + 1, i + 1)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Tuple[K, I]]:
+        """ Yields the (key, item) pairs in key order.
+            :complexity: O(n)
+        """
+        for k in self.in_order_slots():
+            yield self.keys[k], self.items[k]
+
+    def in_order_slots(self) -> Iterator[int]:
+        """ Yields the slots in key order, walking the implicit tree without a stack.
+            :complexity: O(n)
+        """
+        n = self.length
+        if n == 0:
+            return
+        k = 1
+        while 2 * k <= n:  # leftmost slot
+            k *= 2
+        while k > 0:
+            yield k
+            if 2 * k + 1 <= n:  # next is the leftmost slot of the right sub-tree
+                k = 2 * k + 1
+                while 2 * k <= n:
+                    k *= 2
+            else:  # climb while coming from a right child, then once more
+                while k & 1:
+                    k >>= 1
+                k >>= 1
+
+    def ceiling_slot(self, key: K) -> int:
+        """ Returns the slot of the smallest key >= key, or 0 if every key is smaller.
+            The descent records left turns as 0 bits and right turns as 1 bits;
+            dropping the trailing right turns and the last left turn gives its start.
+            :complexity: O(CompK * log n)
+        """
+        keys, n = self.keys, self.length
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] < key)
+        return k >> (~k & (k + 1)).bit_length()
+
+    def floor_slot(self, key: K) -> int:
+        """ Returns the slot of the largest key <= key, or 0 if every key is larger.
+            Mirror image of ceiling_slot: the last right turn is taken at the answer.
+            :complexity: O(CompK * log n)
+        """
+        keys, n = self.keys, self.length
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] <= key)
+        return k >> (k & -k).bit_length()
+
+    def __contains__(self, key: K) -> bool:
+        k = self.ceiling_slot(key)
+        return k != 0 and self.keys[k] == key
+
+    def __getitem__(self, key: K) -> I:
+        """
+            :complexity: O(CompK * log n)
+            :raises KeyError: if the key is not in the tree
+        """
+        k = self.ceiling_slot(key)
+        if k == 0 or self.keys[k] != key:
+            raise KeyError('Key not found: {0}'.format(key))
+        return self.items[k]
+
+    def floor(self, key: K) -> Tuple[K, I] | None:
+        """ Returns the (key, item) pair with the largest key <= key, or None if every key is larger.
+            :complexity: O(CompK * log n)
+        """
+        k = self.floor_slot(key)
+        return None if k == 0 else (self.keys[k], self.items[k])
+
+    def ceiling(self, key: K) -> Tuple[K, I] | None:
+        """ Returns the (key, item) pair with the smallest key >= key, or None if every key is smaller.
+            :complexity: O(CompK * log n)
+        """
+        k = self.ceiling_slot(key)
+        return None if k == 0 else (self.keys[k], self.items[k])
@@ -4,32 +4,76 @@ from __future__ import annotations
 __author__ = "Brendon Taylor, modified by Jackson Goerner"
 __docformat__ = 'reStructuredText'
 
-from typing import Generic
+from array import array
+from typing import Callable, Generic, Iterable, List, Tuple
 
-from data_structures.referential_array import ArrayR, T
+from data_structures.referential_array import ArrayR, NumericArray, T
 
 
 class MaxHeap(Generic[T]):
     MIN_CAPACITY = 1
 
-    def __init__(self, max_size: int) -> None:
+    def __init__(self, max_size: int, resizable: bool = False, arity: int = 2) -> None:
         """
         Args:
             max_size(int): The capacity of the heap
+            resizable(bool): Whether the heap grows when full and shrinks when mostly empty,
+                instead of raising IndexError in add
+            arity(int): The number of children of each node, wider heaps are shallower
 
         Complexity:
             Best case complexity: O(n) where n is the size of the heap.
             Worst case complexity: O(n) where n is the size of the heap.
         """
+        if arity < 2:
+            raise ValueError("Heap arity should be at least 2.")
         self.length: int = 0
+        self.resizable: bool = resizable
+        self.arity: int = arity
         self.the_array: ArrayR[T] = ArrayR(max(self.MIN_CAPACITY, max_size) + 1)
 
     def __len__(self) -> int:
         return self.length
 
+    def capacity(self) -> int:
+        return len(self.the_array) - 1
+
+    def parent(self, k: int) -> int:
+        """
+        Returns the index of k's parent, for a binary heap this is k // 2.
+
+        Pre-condition:
+            2 <= k <= self.length
+        """
+        return (k - 2) // self.arity + 1
+
+    def first_child(self, k: int) -> int:
+        """
+        Returns the index of k's leftmost child, for a binary heap this is 2 * k.
+        The children of k are stored from first_child(k) to first_child(k) + arity - 1.
+        """
+        return self.arity * (k - 1) + 2
+
     def is_full(self) -> bool:
         return self.length + 1 == len(self.the_array)
 
+    def resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements into an array with room for new_capacity elements.
+
+        Pre-condition:
+            new_capacity >= self.length
+
+        Complexity:
+            Best case complexity: O(new_capacity)
+            Worst case complexity: O(new_capacity)
+        """
+        if isinstance(self.the_array, ArrayR):
+            self.the_array.resize(max(self.MIN_CAPACITY, new_capacity) + 1)
+        else:
+            self.the_array = ArrayR.from_iterable(self.the_array[:self.length + 1])
+            self.the_array.resize(max(self.MIN_CAPACITY, new_capacity) + 1)
+
     def rise(self, k: int) -> None:
         """
         Rise element at index k to its correct position
@@ -43,9 +87,11 @@ class MaxHeap(Generic[T]):
             n is the number of elements currently in the heap
         """
         item: T = self.the_array[k]
-        while k > 1 and item > self.the_array[k // 2]:
-            self.the_array[k] = self.the_array[k // 2]
-            k = k // 2
+        arity: int = self.arity
+        while k > 1 and item > self.the_array[(k - 2) // arity + 1]:
+            parent: int = (k - 2) // arity + 1
+            self.the_array[k] = self.the_array[parent]
+            k = parent
         self.the_array[k] = item
 
     def add(self, element: T) -> bool:
@@ -56,9 +102,12 @@ class MaxHeap(Generic[T]):
             Best case complexity: O(1) - No rising required
             Worst case complexity: O(logn) - New largest element (rises to the root)
             n is the number of elements currently in the heap
+            A resizable heap doubles its capacity when full, which is O(1) amortised.
         """
         if self.is_full():
-            raise IndexError
+            if not self.resizable:
+                raise IndexError
+            self.resize(2 * self.capacity())
 
         self.length += 1
         self.the_array[self.length] = element
@@ -69,16 +118,17 @@ class MaxHeap(Generic[T]):
         Returns the index of k's child with greatest value.
 
         Pre-condition:
-            1 <= k <= self.length // 2
+            k has at least one child
 
         Complexity:
-            O(comp) where comp is the cost of comparing two elements in the heap
+            O(arity * comp) where comp is the cost of comparing two elements in the heap
         """
-        if 2 * k == self.length or \
-                self.the_array[2 * k] > self.the_array[2 * k + 1]:
-            return 2 * k
-        else:
-            return 2 * k + 1
+        first: int = self.arity * (k - 1) + 2
+        largest: int = first
+        for child in range(first + 1, min(first + self.arity, self.length + 1)):
+            if self.the_array[child] > self.the_array[largest]:
+                largest = child
+        return largest
 
     def sink(self, k: int) -> None:
         """
@@ -89,12 +139,12 @@ class MaxHeap(Generic[T]):
 
         Complexity:
             Best case complexity: O(1) - No sinking required
-            Worst case complexity: O(logn) - Sinking the root node to the bottom
+            Worst case complexity: O(arity * log_arity(n)) - Sinking the root node to the bottom
             n is the number of elements currently in the heap
         """
         item: T = self.the_array[k]
 
-        while 2 * k <= self.length:
+        while self.arity * (k - 1) + 2 <= self.length:
             max_child: int = self.largest_child(k)
             if self.the_array[max_child] <= item:
                 break
@@ -111,6 +161,7 @@ class MaxHeap(Generic[T]):
                 Best case complexity: O(logn)
                 Worst case complexity: O(logn)
                 n is the number of elements currently in the heap
+                A resizable heap halves its capacity once a quarter full, which is O(1) amortised.
         """
         if self.length == 0:
             raise IndexError
@@ -120,22 +171,859 @@ class MaxHeap(Generic[T]):
         if self.length > 0:
             self.the_array[1] = self.the_array[self.length+1]
             self.sink(1)
+        if self.resizable and self.capacity() > self.MIN_CAPACITY and 4 * self.length <= self.capacity():
+            self.resize(self.capacity() // 2)
+        return max_elt
+
+    def peek(self) -> T:
+        """
+        Returns the maximum element without removing it.
+
+        Complexity:
+            O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1]
+
+    def push_pop(self, element: T) -> T:
+        """
+        Adds the element and then removes (and returns) the maximum, in a single sink.
+        The element itself is returned straight away if it is at least the current maximum.
+
+        Complexity:
+            Best case complexity: O(1) - The element is returned or stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if self.length == 0 or not self.the_array[1] > element:
+            return element
+        return self.replace(element)
+
+    def replace(self, element: T) -> T:
+        """
+        Removes (and returns) the maximum and then adds the element, in a single sink.
+        Unlike push_pop the returned element is always the old maximum.
+
+        Complexity:
+            Best case complexity: O(1) - The element stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if self.length == 0:
+            raise IndexError
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.sink(1)
         return max_elt
 
+    def peek_k(self, k: int) -> List[T]:
+        """
+        Returns the k largest elements in descending order without changing the heap.
+        An auxiliary heap holds the indexes of the candidates: the root first, then the
+        children of every index taken from it.
+
+        Complexity:
+            Best case complexity: O(k * arity * logk)
+            Worst case complexity: O(k * arity * logk)
+        """
+        k = min(k, self.length)
+        result: List[T] = []
+        if k == 0:
+            return result
+        candidates: MaxHeap[tuple] = MaxHeap(k * self.arity, True, self.arity)
+        candidates.add((self.the_array[1], 1))
+        while len(result) < k:
+            element, index = candidates.get_max()
+            result.append(element)
+            first: int = self.first_child(index)
+            for child in range(first, min(first + self.arity, self.length + 1)):
+                candidates.add((self.the_array[child], child))
+        return result
+
+    def ensure_capacity(self, size: int) -> None:
+        """
+        Makes room for size elements, growing at least geometrically.
+
+        Raises:
+            IndexError: If the heap is not resizable and too small.
+
+        Complexity:
+            Best case complexity: O(1) - There is already enough room
+            Worst case complexity: O(size)
+        """
+        if size <= self.capacity():
+            return
+        if not self.resizable:
+            raise IndexError
+        self.resize(max(size, 2 * self.capacity()))
+
+    def _reheapify(self) -> None:
+        """
+        Restores the heap property bottom-up over all elements.
+
+        Complexity:
+            Best case complexity: O(n)
+            Worst case complexity: O(n)
+            n is the number of elements currently in the heap
+        """
+        for k in range((self.length - 2) // self.arity + 1, 0, -1):
+            self.sink(k)
+
+    def _bulk_is_cheaper(self, count: int) -> bool:
+        """
+        Whether re-heapifying bottom-up beats adding count elements one by one,
+        comparing O(n + count) with O(count * log(n + count)).
+        """
+        total: int = self.length + count
+        return count * total.bit_length() > total
+
+    def merge(self, other: MaxHeap[T]) -> None:
+        """
+        Adds every element of other to this heap, leaving other unchanged.
+
+        Raises:
+            IndexError: If the heap is not resizable and too small.
+
+        Complexity:
+            Best case complexity: O(n + m)
+            Worst case complexity: O(n + m)
+            n and m are the number of elements in this heap and in other.
+        """
+        self.ensure_capacity(self.length + len(other))
+        for k in range(1, len(other) + 1):
+            self.the_array[self.length + k] = other.the_array[k]
+        self.length += len(other)
+        self._reheapify()
+
+    def extend(self, elements: Iterable[T]) -> None:
+        """
+        Adds every element, re-heapifying bottom-up once when the batch is large.
+
+        Raises:
+            IndexError: If the heap is not resizable and too small.
+
+        Complexity:
+            Best case complexity: O(n + m) - A batch large enough to re-heapify
+            Worst case complexity: O(m * log(n + m)) - A small batch added one by one
+            n is the number of elements in the heap and m the number of new elements.
+        """
+        elements = elements if isinstance(elements, (list, tuple)) else list(elements)
+        if not self._bulk_is_cheaper(len(elements)):
+            for element in elements:
+                self.add(element)
+            return
+        self.ensure_capacity(self.length + len(elements))
+        for element in elements:
+            self.length += 1
+            self.the_array[self.length] = element
+        self._reheapify()
+
     @staticmethod
-    def heapify(points: ArrayR[T] | List[T], overwrite_size: int = 0) -> MaxHeap[T]:
+    def heapify(points: ArrayR[T] | List[T], overwrite_size: int = 0, resizable: bool = False,
+                take_ownership: bool = False, arity: int = 2) -> MaxHeap[T]:
+        """
+        Args:
+            points: The elements to build the heap from.
+            overwrite_size(int): The capacity of the heap, defaults to 2 * len(points) + 2
+                for fixed heaps and len(points) for resizable ones.
+            resizable(bool): Whether the new heap is resizable.
+            take_ownership(bool): If points is a list the caller no longer uses, build the heap
+                inside it instead of copying it. The list is rearranged and must not be used again.
+            arity(int): The number of children of each node.
+
+        Complexity:
+            Best case complexity: O(n)
+            Worst case complexity: O(n)
+            n is the number of elements inside points.
+        """
+        n: int = len(points)
+        if take_ownership and isinstance(points, list):
+            new_heap = MaxHeap(MaxHeap.MIN_CAPACITY, resizable, arity)
+            # The heap is 1-indexed: move the first element to the end to free slot 0
+            points.append(points[0] if n > 0 else None)
+            points[0] = None
+            new_heap.the_array = points
+            if overwrite_size > n:
+                new_heap.resize(overwrite_size)
+        else:
+            new_heap = MaxHeap(overwrite_size or (n if resizable else 2 * n + 2), resizable, arity)
+            for i in range(n):
+                new_heap.the_array[i+1] = points[i]
+        new_heap.length = n
+        new_heap._reheapify()
+        return new_heap
+
+
+class KeyedMaxHeap(MaxHeap[T]):
+    """
+    Max heap ordered by a float priority per element rather than by comparing the elements.
+    The priorities live in a NumericArray alongside the_array, so sink and rise only compare
+    floats and elements themselves never need to be comparable.
+    """
+
+    def __init__(self, max_size: int, key: Callable[[T], float] | None = None, resizable: bool = False,
+                 arity: int = 2) -> None:
+        """
+        Args:
+            max_size(int): The capacity of the heap
+            key(Callable[[T], float] | None): Computes the priority of an element added without one
+            resizable(bool): Whether the heap grows when full and shrinks when mostly empty
+            arity(int): The number of children of each node
+
+        Complexity:
+            Best case complexity: O(n) where n is the size of the heap.
+            Worst case complexity: O(n) where n is the size of the heap.
+        """
+        MaxHeap.__init__(self, max_size, resizable, arity)
+        self.key: Callable[[T], float] | None = key
+        self.priorities: NumericArray = NumericArray(len(self.the_array), 'd')
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Pre-condition:
+            new_capacity >= self.length
+
+        Complexity:
+            Best case complexity: O(new_capacity)
+            Worst case complexity: O(new_capacity)
+        """
+        MaxHeap.resize(self, new_capacity)
+        self.priorities.resize(len(self.the_array))
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position
+
+        Pre-condition:
+            1 <= k <= self.length
+
+        Complexity:
+            Best case complexity: O(1) - Rising the root element
+            Worst case complexity: O(logn) - Rising a leaf element
+            n is the number of elements currently in the heap
+        """
+        items, priorities = self.the_array, self.priorities.view()
+        item: T = items[k]
+        priority: float = priorities[k]
+        arity: int = self.arity
+        while k > 1 and priority > priorities[(k - 2) // arity + 1]:
+            parent: int = (k - 2) // arity + 1
+            items[k] = items[parent]
+            priorities[k] = priorities[parent]
+            k = parent
+        items[k] = item
+        priorities[k] = priority
+
+    def add(self, element: T, priority: float | None = None) -> None:
+        """
+        Args:
+            element(T): The element to add
+            priority(float | None): Its priority, computed with the key function when None
+
+        Complexity:
+            Best case complexity: O(1) - No rising required
+            Worst case complexity: O(logn) - New largest element (rises to the root)
+            n is the number of elements currently in the heap
+        """
+        if priority is None:
+            priority = self.key(element)
+        if self.is_full():
+            if not self.resizable:
+                raise IndexError
+            self.resize(2 * self.capacity())
+
+        self.length += 1
+        self.the_array[self.length] = element
+        self.priorities[self.length] = priority
+        self.rise(self.length)
+
+    def largest_child(self, k: int, priorities: memoryview | None = None) -> int:
+        """
+        Returns the index of k's child with greatest priority.
+        sink passes the view of the priorities it already holds, instead of one per level.
+
+        Pre-condition:
+            k has at least one child
+
+        Complexity:
+            O(arity)
+        """
+        if priorities is None:
+            priorities = self.priorities.view()
+        first: int = self.arity * (k - 1) + 2
+        largest: int = first
+        for child in range(first + 1, min(first + self.arity, self.length + 1)):
+            if priorities[child] > priorities[largest]:
+                largest = child
+        return largest
+
+    def sink(self, k: int) -> None:
+        """
+        Make the element at index k sink to the correct position.
+
+        Pre-condition:
+            1 <= k <= self.length
+
+        Complexity:
+            Best case complexity: O(1) - No sinking required
+            Worst case complexity: O(arity * log_arity(n)) - Sinking the root node to the bottom
+            n is the number of elements currently in the heap
+        """
+        items, priorities = self.the_array, self.priorities.view()
+        item: T = items[k]
+        priority: float = priorities[k]
+
+        while self.arity * (k - 1) + 2 <= self.length:
+            max_child: int = self.largest_child(k, priorities)
+            if priorities[max_child] <= priority:
+                break
+            items[k] = items[max_child]
+            priorities[k] = priorities[max_child]
+            k = max_child
+
+        items[k] = item
+        priorities[k] = priority
+
+    def max_priority(self) -> float:
+        """
+        Returns the priority of the maximum element without removing it.
+
+        Complexity:
+            O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.priorities[1]
+
+    def push_pop(self, element: T, priority: float | None = None) -> T:
+        """
+        Adds the element and then removes (and returns) the maximum, in a single sink.
+
+        Complexity:
+            Best case complexity: O(1) - The element is returned or stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if priority is None:
+            priority = self.key(element)
+        if self.length == 0 or not self.priorities[1] > priority:
+            return element
+        return self.replace(element, priority)
+
+    def replace(self, element: T, priority: float | None = None) -> T:
+        """
+        Removes (and returns) the maximum and then adds the element, in a single sink.
+
+        Complexity:
+            Best case complexity: O(1) - The element stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if self.length == 0:
+            raise IndexError
+        if priority is None:
+            priority = self.key(element)
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.priorities[1] = priority
+        self.sink(1)
+        return max_elt
+
+    def peek_k(self, k: int) -> List[T]:
+        """
+        Returns the k elements with the highest priorities in descending order without
+        changing the heap, using an auxiliary heap over their indexes.
+
+        Complexity:
+            Best case complexity: O(k * arity * logk)
+            Worst case complexity: O(k * arity * logk)
+        """
+        k = min(k, self.length)
+        result: List[T] = []
+        if k == 0:
+            return result
+        candidates: KeyedMaxHeap[int] = KeyedMaxHeap(k * self.arity, None, True, self.arity)
+        candidates.add(1, self.priorities[1])
+        while len(result) < k:
+            index: int = candidates.get_max()
+            result.append(self.the_array[index])
+            first: int = self.first_child(index)
+            for child in range(first, min(first + self.arity, self.length + 1)):
+                candidates.add(child, self.priorities[child])
+        return result
+
+    def merge(self, other: KeyedMaxHeap[T]) -> None:
+        """
+        Adds every element of other, with its priority, leaving other unchanged.
+
+        Raises:
+            IndexError: If the heap is not resizable and too small.
+
+        Complexity:
+            Best case complexity: O(n + m)
+            Worst case complexity: O(n + m)
+            n and m are the number of elements in this heap and in other.
+        """
+        self.ensure_capacity(self.length + len(other))
+        for k in range(1, len(other) + 1):
+            self.the_array[self.length + k] = other.the_array[k]
+            self.priorities[self.length + k] = other.priorities[k]
+        self.length += len(other)
+        self._reheapify()
+
+    def extend(self, elements: Iterable[T], priorities: Iterable[float] | None = None) -> None:
         """
+        Adds every element, re-heapifying bottom-up once when the batch is large.
+        Priorities are given in the same order as the elements or computed with the key function.
+
+        Complexity:
+            Best case complexity: O(n + m) - A batch large enough to re-heapify
+            Worst case complexity: O(m * log(n + m)) - A small batch added one by one
+            n is the number of elements in the heap and m the number of new elements.
+        """
+        elements = elements if isinstance(elements, (list, tuple)) else list(elements)
+        priorities = map(self.key, elements) if priorities is None else priorities
+        if not self._bulk_is_cheaper(len(elements)):
+            for element, priority in zip(elements, priorities):
+                self.add(element, priority)
+            return
+        self.ensure_capacity(self.length + len(elements))
+        for element, priority in zip(elements, priorities):
+            self.length += 1
+            self.the_array[self.length] = element
+            self.priorities[self.length] = priority
+        self._reheapify()
+
+    def get_max(self) -> T:
+        """
+            Remove (and return) the maximum element from the heap.
+
+            Complexity:
+                Best case complexity: O(logn)
+                Worst case complexity: O(logn)
+                n is the number of elements currently in the heap
+        """
+        if self.length == 0:
+            raise IndexError
+
+        max_elt = self.the_array[1]
+        self.length -= 1
+        if self.length > 0:
+            self.the_array[1] = self.the_array[self.length+1]
+            self.priorities[1] = self.priorities[self.length+1]
+            self.sink(1)
+        if self.resizable and self.capacity() > self.MIN_CAPACITY and 4 * self.length <= self.capacity():
+            self.resize(self.capacity() // 2)
+        return max_elt
+
+    @staticmethod
+    def heapify(points: ArrayR[T] | List[T], key: Callable[[T], float] | None = None,
+                priorities: Iterable[float] | None = None, resizable: bool = False, arity: int = 2) -> KeyedMaxHeap[T]:
+        """
+        Args:
+            points: The elements to build the heap from.
+            key(Callable[[T], float] | None): Computes the priorities when none are given,
+                and those of elements added later.
+            priorities(Iterable[float] | None): The priority of each element of points, in order.
+            resizable(bool): Whether the new heap is resizable.
+            arity(int): The number of children of each node.
+
+        Complexity:
+            Best case complexity: O(n)
+            Worst case complexity: O(n)
+            n is the number of elements inside points.
+        """
+        n: int = len(points)
+        new_heap: KeyedMaxHeap[T] = KeyedMaxHeap(n if resizable else 2 * n + 2, key, resizable, arity)
+        if priorities is None:
+            priorities = map(key, points) if isinstance(points, list) else (key(points[i]) for i in range(n))
+        for i, priority in enumerate(priorities, 1):
+            new_heap.priorities[i] = priority
+        for i in range(n):
+            new_heap.the_array[i+1] = points[i]
+        new_heap.length = n
+        new_heap._reheapify()
+        return new_heap
+
+
+class IndexedMaxHeap(KeyedMaxHeap[T]):
+    """
+    Keyed max heap whose elements can be addressed after insertion.
+    add returns an integer handle, and the heap keeps the position of every handle up to date
+    as elements rise and sink, so priorities can be changed and arbitrary elements removed.
+    """
+
+    ABSENT = -1
+
+    def __init__(self, max_size: int, key: Callable[[T], float] | None = None, resizable: bool = False,
+                 arity: int = 2) -> None:
+        """
+        Args:
+            max_size(int): The capacity of the heap
+            key(Callable[[T], float] | None): Computes the priority of an element added without one
+            resizable(bool): Whether the heap grows when full and shrinks when mostly empty
+            arity(int): The number of children of each node
+
+        Complexity:
+            Best case complexity: O(n) where n is the size of the heap.
+            Worst case complexity: O(n) where n is the size of the heap.
+        """
+        KeyedMaxHeap.__init__(self, max_size, key, resizable, arity)
+        self.handles: NumericArray = NumericArray(len(self.the_array), 'l')
+        self.positions: NumericArray = NumericArray(len(self.the_array), 'l')
+        self.handle_count: int = 0
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Pre-condition:
+            new_capacity >= self.length
+
+        Complexity:
+            Best case complexity: O(new_capacity)
+            Worst case complexity: O(new_capacity)
+        """
+        KeyedMaxHeap.resize(self, new_capacity)
+        self.handles.resize(len(self.the_array))
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position, updating the positions of moved handles.
+
+        Pre-condition:
+            1 <= k <= self.length
+
+        Complexity:
+            Best case complexity: O(1) - Rising the root element
+            Worst case complexity: O(logn) - Rising a leaf element
+            n is the number of elements currently in the heap
+        """
+        items, priorities = self.the_array, self.priorities.view()
+        handles, positions = self.handles.view(), self.positions.view()
+        item: T = items[k]
+        priority: float = priorities[k]
+        handle: int = handles[k]
+        arity: int = self.arity
+        while k > 1 and priority > priorities[(k - 2) // arity + 1]:
+            parent: int = (k - 2) // arity + 1
+            items[k] = items[parent]
+            priorities[k] = priorities[parent]
+            handles[k] = handles[parent]
+            positions[handles[k]] = k
+            k = parent
+        items[k] = item
+        priorities[k] = priority
+        handles[k] = handle
+        positions[handle] = k
+
+    def sink(self, k: int) -> None:
+        """
+        Make the element at index k sink to the correct position, updating the positions of moved handles.
+
+        Pre-condition:
+            1 <= k <= self.length
+
+        Complexity:
+            Best case complexity: O(1) - No sinking required
+            Worst case complexity: O(arity * log_arity(n)) - Sinking the root node to the bottom
+            n is the number of elements currently in the heap
+        """
+        items, priorities = self.the_array, self.priorities.view()
+        handles, positions = self.handles.view(), self.positions.view()
+        item: T = items[k]
+        priority: float = priorities[k]
+        handle: int = handles[k]
+
+        while self.arity * (k - 1) + 2 <= self.length:
+            max_child: int = self.largest_child(k, priorities)
+            if priorities[max_child] <= priority:
+                break
+            items[k] = items[max_child]
+            priorities[k] = priorities[max_child]
+            handles[k] = handles[max_child]
+            positions[handles[k]] = k
+            k = max_child
+
+        items[k] = item
+        priorities[k] = priority
+        handles[k] = handle
+        positions[handle] = k
+
+    def add(self, element: T, priority: float | None = None) -> int:
+        """
+        Args:
+            element(T): The element to add
+            priority(float | None): Its priority, computed with the key function when None
+
+        Returns:
+            int: The handle of the new element
+
+        Complexity:
+            Best case complexity: O(1) - No rising required
+            Worst case complexity: O(logn) - New largest element (rises to the root)
+            n is the number of elements currently in the heap
+        """
+        if priority is None:
+            priority = self.key(element)
+        if self.is_full():
+            if not self.resizable:
+                raise IndexError
+            self.resize(2 * self.capacity())
+
+        handle: int = self._reserve_handles(1)
+        self.length += 1
+        self.the_array[self.length] = element
+        self.priorities[self.length] = priority
+        self.handles[self.length] = handle
+        self.rise(self.length)
+        return handle
+
+    def _reserve_handles(self, count: int) -> int:
+        """
+        Hands out the next count handles, all absent, doubling positions when they do not fit.
+
+        Returns:
+            int: The first of the new handles
+
+        Complexity:
+            O(count) amortised
+        """
+        offset: int = self.handle_count
+        self.handle_count += count
+        if self.handle_count > len(self.positions):
+            self.positions.resize(max(self.handle_count, 2 * len(self.positions)))
+        self.positions[offset:self.handle_count] = array('l', [self.ABSENT]) * count
+        return offset
+
+    def contains(self, handle: int) -> bool:
+        """
+        Complexity:
+            O(1)
+        """
+        return 0 <= handle < self.handle_count and self.positions[handle] != self.ABSENT
+
+    def __contains__(self, handle: int) -> bool:
+        return self.contains(handle)
+
+    def _position_of(self, handle: int) -> int:
+        if not self.contains(handle):
+            raise KeyError(f"Handle not in heap: {handle}")
+        return self.positions[handle]
+
+    def item(self, handle: int) -> T:
+        """
+        Complexity:
+            O(1)
+        """
+        return self.the_array[self._position_of(handle)]
+
+    def priority(self, handle: int) -> float:
+        """
+        Complexity:
+            O(1)
+        """
+        return self.priorities[self._position_of(handle)]
+
+    def update_priority(self, handle: int, priority: float) -> None:
+        """
+        Changes the priority of the element with the given handle.
+
+        Raises:
+            KeyError: If the handle is not in the heap.
+
+        Complexity:
+            Best case complexity: O(1) - The element stays in place
+            Worst case complexity: O(logn) - The element rises to the root or sinks to a leaf
+            n is the number of elements currently in the heap
+        """
+        k: int = self._position_of(handle)
+        old_priority: float = self.priorities[k]
+        self.priorities[k] = priority
+        if priority > old_priority:
+            self.rise(k)
+        else:
+            self.sink(k)
+
+    def _remove_at(self, k: int) -> T:
+        """
+        Removes the element at index k by moving the last element into its place.
+
+        Complexity:
+            Best case complexity: O(1) - The last element stays in place
+            Worst case complexity: O(logn)
+            n is the number of elements currently in the heap
+        """
+        removed: T = self.the_array[k]
+        self.positions[self.handles[k]] = self.ABSENT
+        last: int = self.length
+        self.length -= 1
+        if k != last:
+            self.the_array[k] = self.the_array[last]
+            self.priorities[k] = self.priorities[last]
+            self.handles[k] = self.handles[last]
+            self.positions[self.handles[k]] = k
+            if k > 1 and self.priorities[k] > self.priorities[self.parent(k)]:
+                self.rise(k)
+            else:
+                self.sink(k)
+        if self.resizable and self.capacity() > self.MIN_CAPACITY and 4 * self.length <= self.capacity():
+            self.resize(self.capacity() // 2)
+        return removed
+
+    def remove(self, handle: int) -> T:
+        """
+        Removes (and returns) the element with the given handle.
+
+        Raises:
+            KeyError: If the handle is not in the heap.
+
+        Complexity:
+            Best case complexity: O(1) - Removing the last element
+            Worst case complexity: O(logn)
+            n is the number of elements currently in the heap
+        """
+        return self._remove_at(self._position_of(handle))
+
+    def push_pop(self, element: T, priority: float | None = None) -> Tuple[T, int]:
+        """
+        Adds the element and then removes (and returns) the maximum, in a single sink.
+        The element always gets a handle, which is already absent when the element itself
+        is the maximum and comes straight back.
+
+        Returns:
+            Tuple[T, int]: The removed maximum and the handle of the added element
+
+        Complexity:
+            Best case complexity: O(1) - The element is returned or stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if priority is None:
+            priority = self.key(element)
+        if self.length == 0 or not self.priorities[1] > priority:
+            return element, self._reserve_handles(1)
+        return self.replace(element, priority)
+
+    def replace(self, element: T, priority: float | None = None) -> Tuple[T, int]:
+        """
+        Removes (and returns) the maximum and then adds the element, in a single sink.
+        The handle of the removed maximum becomes absent.
+
+        Returns:
+            Tuple[T, int]: The removed maximum and the handle of the added element
+
+        Complexity:
+            Best case complexity: O(1) - The element stays at the root
+            Worst case complexity: O(logn) - The element sinks to the bottom
+            n is the number of elements currently in the heap
+        """
+        if self.length == 0:
+            raise IndexError
+        if priority is None:
+            priority = self.key(element)
+        handle: int = self._reserve_handles(1)
+        max_elt = self.the_array[1]
+        self.positions[self.handles[1]] = self.ABSENT
+        self.the_array[1] = element
+        self.priorities[1] = priority
+        self.handles[1] = handle
+        self.sink(1)
+        return max_elt, handle
+
+    def merge(self, other: KeyedMaxHeap[T]) -> int:
+        """
+        Adds every element of other, with its priority, leaving other unchanged.
+        The elements get new handles after every handle this heap has given out: the element
+        with handle h in an indexed other gets handle offset + h, and the element at index k
+        of a heap without handles gets handle offset + k - 1.
+
+        Returns:
+            int: The offset added to the handles of other
+
+        Raises:
+            IndexError: If the heap is not resizable and too small.
+
+        Complexity:
+            Best case complexity: O(n + m)
+            Worst case complexity: O(n + m + h)
+            n and m are the number of elements in this heap and in other,
+            h the number of handles other has given out.
+        """
+        self.ensure_capacity(self.length + len(other))
+        indexed: bool = isinstance(other, IndexedMaxHeap)
+        offset: int = self._reserve_handles(other.handle_count if indexed else len(other))
+        for k in range(1, len(other) + 1):
+            position: int = self.length + k
+            handle: int = offset + (other.handles[k] if indexed else k - 1)
+            self.the_array[position] = other.the_array[k]
+            self.priorities[position] = other.priorities[k]
+            self.handles[position] = handle
+            self.positions[handle] = position
+        self.length += len(other)
+        self._reheapify()
+        return offset
+
+    def extend(self, elements: Iterable[T], priorities: Iterable[float] | None = None) -> List[int]:
+        """
+        Adds every element, returning their handles in order.
+
+        Complexity:
+            Best case complexity: O(m)
+            Worst case complexity: O(m * log(n + m))
+            n is the number of elements in the heap and m the number of new elements.
+        """
+        if priorities is None:
+            return [self.add(element) for element in elements]
+        return [self.add(element, priority) for element, priority in zip(elements, priorities)]
+
+    def peek_handle(self) -> int:
+        """
+        Returns the handle of the maximum element without removing it.
+
+        Complexity:
+            O(1)
+        """
+        if self.length == 0:
+            raise IndexError
+        return self.handles[1]
+
+    def get_max(self) -> T:
+        """
+            Remove (and return) the maximum element from the heap.
+
+            Complexity:
+                Best case complexity: O(logn)
+                Worst case complexity: O(logn)
+                n is the number of elements currently in the heap
+        """
+        if self.length == 0:
+            raise IndexError
+        return self._remove_at(1)
+
+    @staticmethod
+    def heapify(points: ArrayR[T] | List[T], key: Callable[[T], float] | None = None,
+                priorities: Iterable[float] | None = None, resizable: bool = False, arity: int = 2) -> IndexedMaxHeap[T]:
+        """
+        Builds a heap where the element at index i of points gets handle i.
+
         Complexity:
             Best case complexity: O(n)
             Worst case complexity: O(n)
             n is the number of elements inside points.
         """
-        new_heap = MaxHeap(overwrite_size or (2 * len(points) + 2))
-        new_heap.length = len(points)
-        for i in range(len(points)):
+        n: int = len(points)
+        new_heap: IndexedMaxHeap[T] = IndexedMaxHeap(n if resizable else 2 * n + 2, key, resizable, arity)
+        if priorities is None:
+            priorities = (key(points[i]) for i in range(n))
+        for i, priority in enumerate(priorities, 1):
+            new_heap.priorities[i] = priority
+        new_heap._reserve_handles(n)
+        for i in range(n):
             new_heap.the_array[i+1] = points[i]
-        for k in range(len(points), 0, -1):
-            new_heap.sink(k)
+            new_heap.handles[i+1] = i
+            new_heap.positions[i] = i + 1
+        new_heap.length = n
+        new_heap._reheapify()
         return new_heap
 
 
@@ -22,7 +22,12 @@ class TreeNode(Generic[K, I]):
             depth: the depth of the node in the tree
             The leaf of the largest subtree will have a
             depth equal to the height of the tree.
-            
+            height: the number of nodes on the longest path from
+            this node down to a leaf.
+            min_height: the number of nodes on the shortest path from
+            this node down to a leaf.
+            size: the number of nodes in the sub-tree rooted at this node.
+
             :complexity: O(1)
         """
         self.key = key
@@ -30,6 +35,9 @@ class TreeNode(Generic[K, I]):
         self.left = None
         self.right = None
         self.depth = depth
+        self.height = 1
+        self.min_height = 1
+        self.size = 1
 
     def __str__(self):
         """
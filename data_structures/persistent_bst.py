@@ -0,0 +1,208 @@
+""" Persistent Binary Search Tree ADT.
+    Writes never modify a node: they copy the path from the root down to the
+    change and share every other sub-tree with the previous version, so any
+    version handed out earlier stays valid and can be read while writes go on.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar
+
+from data_structures.bst import BinarySearchTree
+from data_structures.node import TreeNode
+
+# generic types
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class PersistentBST(BinarySearchTree[K, I]):
+    """ Binary search tree whose nodes are immutable once linked.
+        A tree object is a handle on one version: __setitem__, __delitem__, split and join
+        move the handle to a new version, insert and delete return one and leave the handle alone.
+        Iterating a handle walks the version it held when the iteration started.
+    """
+
+    def snapshot(self) -> PersistentBST[K, I]:
+        """ Returns a handle on the current version, unaffected by later writes to this one.
+            :complexity: O(1)
+        """
+        version = type(self)()
+        version.root = self.root
+        version.length = self.length
+        version.shape_stats = self.shape_stats
+        return version
+
+    def insert(self, key: K, item: I) -> PersistentBST[K, I]:
+        """ Returns a new version that also maps key to item.
+            :complexity: O(CompK * D) where D is the depth of the tree
+            :raises ValueError: if the key is already in the tree
+        """
+        version = self.snapshot()
+        version[key] = item
+        return version
+
+    def delete(self, key: K) -> PersistentBST[K, I]:
+        """ Returns a new version without key.
+            :complexity: O(CompK * D) where D is the depth of the tree
+            :raises ValueError: if the key is not in the tree
+        """
+        version = self.snapshot()
+        del version[key]
+        return version
+
+    @staticmethod
+    def copy_node(current: TreeNode) -> TreeNode:
+        """ Returns an unshared copy of a node, pointing at the same children.
+            :complexity: O(1)
+        """
+        copy = TreeNode(current.key, current.item, current.depth)
+        copy.left, copy.right = current.left, current.right
+        copy.height, copy.min_height, copy.size = current.height, current.min_height, current.size
+        return copy
+
+    @staticmethod
+    def attach(root: TreeNode | None, parent: TreeNode | None, left: bool, child: TreeNode | None) -> TreeNode | None:
+        """ Links child below a copied parent, or makes it the root without a parent,
+            and returns the root of the new version.
+            :complexity: O(1)
+        """
+        if parent is None:
+            return child
+        if left:
+            parent.left = child
+        else:
+            parent.right = child
+        return root
+
+    def insert_aux(self, current: TreeNode, key: K, item: I, current_depth: int) -> TreeNode:
+        """
+            Returns the root of a new version holding the item, made of copies of the
+            nodes on the search path and the sub-trees of the old version hanging off it.
+            :complexity: O(CompK * D) where D is the depth of the tree, allocating D + 1 nodes
+            :raises ValueError: if the key is already in the tree
+        """
+        root, parent, left = None, None, False
+        path = []
+        node = current
+        while node is not None:
+            if key == node.key:
+                raise ValueError('Inserting duplicate item')
+            copy = self.copy_node(node)
+            root = self.attach(root, parent, left, copy)
+            path.append(copy)
+            parent, left = copy, key < node.key
+            node = node.left if left else node.right
+        root = self.attach(root, parent, left, TreeNode(key, item, current_depth + len(path)))
+        self.refresh_path(path)
+        self.length += 1
+        return root
+
+    def delete_aux(self, current: TreeNode, key: K) -> TreeNode:
+        """
+            Returns the root of a new version without the key, copying the nodes on the
+            path to the key and, for a node with two children, on the path to its successor.
+            :complexity: O(CompK * D) where D is the depth of the tree, allocating at most D nodes
+            :raises ValueError: if the key is not in the tree
+        """
+        root, parent, left = None, None, False
+        path = []
+        node = current
+        while node is not None and key != node.key:
+            copy = self.copy_node(node)
+            root = self.attach(root, parent, left, copy)
+            path.append(copy)
+            parent, left = copy, key < node.key
+            node = node.left if left else node.right
+        if node is None:  # key not found
+            raise ValueError('Deleting non-existent item')
+
+        if node.left is not None and node.right is not None:
+            # the copy of node takes the successor's pair, and the successor is unlinked
+            copy = self.copy_node(node)
+            root = self.attach(root, parent, left, copy)
+            path.append(copy)
+            parent, left = copy, False
+            succ = node.right
+            while succ.left is not None:
+                succ_copy = self.copy_node(succ)
+                root = self.attach(root, parent, left, succ_copy)
+                path.append(succ_copy)
+                parent, left = succ_copy, True
+                succ = succ.left
+            copy.key, copy.item = succ.key, succ.item
+            node = succ
+
+        child = node.left if node.left is not None else node.right
+        root = self.attach(root, parent, left, child)
+        self.refresh_path(path)
+        self.length -= 1
+        return root
+
+    def split(self, key: K) -> PersistentBST[K, I]:
+        """ Moves the handle to a version with the pairs whose key < key, and returns
+            a handle on a version with the others. The nodes on the search path for key
+            are copied before being relinked, every other sub-tree is shared.
+            :complexity: O(CompK * D) where D is the depth of the tree, allocating at most D nodes
+        """
+        self.shape_stats = None
+        upper = type(self)()
+        lower_root = lower_tail = upper_tail = None
+        path = []
+        current = self.root
+        while current is not None:
+            copy = self.copy_node(current)
+            path.append(copy)
+            if copy.key < key:  # copy and its left sub-tree stay
+                lower_root = self.attach(lower_root, lower_tail, False, copy)
+                lower_tail, current = copy, copy.right
+            else:  # copy and its right sub-tree move
+                upper.root = self.attach(upper.root, upper_tail, True, copy)
+                upper_tail, current = copy, copy.left
+        if lower_tail is not None:
+            lower_tail.right = None
+        if upper_tail is not None:
+            upper_tail.left = None
+        self.refresh_path(path)  # children on the path are fixed before their parents
+        self.root = lower_root
+        upper.length = self.get_size(upper.root)
+        self.length -= upper.length
+        return upper
+
+    def join(self, other: BinarySearchTree[K, I]) -> None:
+        """ Moves the handle to a version holding the pairs of both trees, whose keys must
+            all be greater in other, and empties the other handle. The right spine of this
+            version is copied and its maximal node becomes the new root, while the nodes of
+            other are shared, so no earlier version of either tree changes.
+            :complexity: O(CompK * (D1 + D2)) where D1 and D2 are the depths of the trees,
+                allocating D1 nodes
+            :raises ValueError: if a key of other is not greater than every key of this tree
+        """
+        if other.root is None:
+            return
+        self.shape_stats = None
+        if self.root is not None:
+            if not self.get_maximal(self.root).key < self.get_minimal(other.root).key:
+                raise ValueError('Joined keys must be greater than every key in the tree')
+            root, parent = None, None
+            spine = []
+            current = self.root
+            while current.right is not None:
+                copy = self.copy_node(current)
+                root = self.attach(root, parent, False, copy)
+                spine.append(copy)
+                parent, current = copy, current.right
+            root = self.attach(root, parent, False, current.left)
+            self.refresh_path(spine)
+            top = self.copy_node(current)
+            top.left, top.right = root, other.root
+            self.refresh(top)
+            self.root = top
+        else:
+            self.root = other.root
+        self.length += other.length
+        other.root = None
+        other.length = 0
+        other.shape_stats = None
@@ -12,12 +12,20 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+Both getitem and setitem also accept slices, which ctypes handles in C:
+a slice read returns a list and a slice write must keep the same length.
+Arrays that only ever hold ints or floats can use NumericArray instead,
+which stores raw machine values in an `array` and exposes them as a memoryview.
 """
+from __future__ import annotations
+
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
+from array import array
 from ctypes import py_object
-from typing import Generic, TypeVar
+from typing import Generic, Iterable, List, TypeVar
 
 T = TypeVar('T')
 
@@ -31,7 +39,34 @@ class ArrayR(Generic[T]):
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
         self.array = (length * py_object)()  # initialises the space
-        self.array[:] = [None for _ in range(length)]
+        self.array[:] = [None] * length
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> ArrayR[T]:
+        """ Creates an array holding the given items, filled in a single C-level pass
+        :complexity: O(n) for best/worst case, where n is the number of items
+        :pre: there is at least one item
+        """
+        values = items if isinstance(items, (list, tuple)) else tuple(items)
+        if len(values) == 0:
+            raise ValueError("Array length should be larger than 0.")
+        new_array = cls.__new__(cls)
+        new_array.array = (len(values) * py_object)()
+        new_array.array[:] = values
+        return new_array
+
+    def resize(self, length: int) -> None:
+        """ Changes the length of the array, keeping the first min(length, len(self)) items
+        and filling any new positions with None. The items are moved with one slice copy.
+        :complexity: O(length) for best/worst case
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        kept = min(length, len(self.array))
+        new_array = (length * py_object)()
+        new_array[:] = self.array[:kept] + [None] * (length - kept)
+        self.array = new_array
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -39,16 +74,91 @@ class ArrayR(Generic[T]):
         """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index.
-        :complexity: O(1)
+    def __getitem__(self, index: int | slice) -> T | List[T]:
+        """ Returns the object in position index, or a list of the objects in a slice.
+        :complexity: O(1) for an index, O(k) for a slice of k objects
         :pre: index in between 0 and length - self.array[] checks it
         """
         return self.array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
-        :complexity: O(1)
+    def __setitem__(self, index: int | slice, value: T | Iterable[T]) -> None:
+        """ Sets the object in position index to value, or the objects in a slice to those in value.
+        :complexity: O(1) for an index, O(k) for a slice of k objects
         :pre: index in between 0 and length - self.array[] checks it
+        :pre: a slice and value have the same length
+        """
+        self.array[index] = value
+
+
+class NumericArray:
+    """ Fixed length array of ints or floats stored as raw machine values.
+
+    The values live in an `array` of the given type code (e.g. 'l' for ints,
+    'd' for floats), which needs no object per element and can be handed to
+    other code without copying through view().
+    """
+
+    def __init__(self, length: int, typecode: str = 'd') -> None:
+        """ Creates a zero-filled array of the given length
+        :complexity: O(length) for best/worst case
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        self.array = array(typecode, bytes(array(typecode).itemsize * length))
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[int | float], typecode: str = 'd') -> NumericArray:
+        """ Creates an array holding the given numbers
+        :complexity: O(n) for best/worst case, where n is the number of items
+        :pre: there is at least one item
+        """
+        new_array = cls.__new__(cls)
+        new_array.array = array(typecode, items)
+        if len(new_array.array) == 0:
+            raise ValueError("Array length should be larger than 0.")
+        return new_array
+
+    @property
+    def typecode(self) -> str:
+        return self.array.typecode
+
+    def view(self) -> memoryview:
+        """ Returns a memoryview sharing this array's memory, no values are copied.
+        The array must not be resized while the view is alive.
+        :complexity: O(1)
+        """
+        return memoryview(self.array)
+
+    def resize(self, length: int) -> None:
+        """ Changes the length of the array in place, zero-filling any new positions
+        :complexity: O(|length - len(self)|) amortised
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        if length > len(self.array):
+            self.array.frombytes(bytes(self.array.itemsize * (length - len(self.array))))
+        else:
+            del self.array[length:]
+
+    def __len__(self) -> int:
+        """ Returns the length of the array
+        :complexity: O(1)
+        """
+        return len(self.array)
+
+    def __getitem__(self, index: int | slice) -> int | float | array:
+        """ Returns the number in position index, or an array of the numbers in a slice.
+        :complexity: O(1) for an index, O(k) for a slice of k numbers
+        """
+        return self.array[index]
+
+    def __setitem__(self, index: int | slice, value: int | float | Iterable) -> None:
+        """ Sets the number in position index, or the numbers in a slice.
+        :complexity: O(1) for an index, O(k) for a slice of k numbers
+        :pre: a slice and value have the same length
         """
+        if isinstance(index, slice) and not isinstance(value, array):
+            value = array(self.array.typecode, value)
         self.array[index] = value
\ No newline at end of file
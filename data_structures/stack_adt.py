@@ -15,6 +15,8 @@ T = TypeVar('T')
 class Stack(ABC, Generic[T]):
     """ Abstract Stack class. """
 
+    __slots__ = ('length',)
+
     def __init__(self) -> None:
         """ Object initializer. """
         self.length = 0
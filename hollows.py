@@ -8,11 +8,13 @@ And ensure your treasure data structure is not banned.
 """
 
 from abc import ABC, abstractmethod
+from inspect import signature
 from typing import List, Union
 
 from config import Tiles
-from treasure import Treasure, generate_treasures
-from data_structures.heap import MaxHeap
+from random_gen import RandomGen
+from treasure import Treasure, TreasureTable, generate_treasures
+from data_structures.heap import KeyedMaxHeap
 
 class Hollow(ABC):
     """
@@ -20,22 +22,196 @@ class Hollow(ABC):
     There are two types of hollows that can be found in the maze:
     - Spooky Hollows: Each of these hollows contains unique treasures that can be found nowhere else in the maze.
     - Mystical Hollows: These hollows contain a random assortment of treasures like the spooky hollow however all mystical hollows are connected, so if you remove a treasure from one mystical hollow, it will be removed from all other mystical hollows.
+
+    The treasures themselves live in a `TreasureTable`, the hollow only keeps the range of rows
+    it owns and a heap of rows keyed by their ratio. A row is in the hollow while its `held` flag in the
+    table is set; removed rows are dropped from the heap lazily when they reach the top.
+
+    Hollows are created as placeholders: each takes the next substream of the default `RandomGen`
+    stream on construction, and the treasures are generated and restructured the first time they
+    are needed. Substreams never overlap, so the treasures do not depend on the order in which
+    hollows are touched.
     """
 
-    def __init__(self) -> None:
-        self.treasures = self.gen_treasures()
+    def __init__(self, table: TreasureTable | None = None) -> None:
+        """
+        Args:
+            table (TreasureTable | None): The table to store this hollow's treasures in,
+                a private table is created when none is given.
+
+        Complexity:
+            O(1)
+        """
+        self.table: TreasureTable = table if table is not None else TreasureTable()
+        self.treasure_seed: int | None = RandomGen.split().seed
+
+    def _materialise(self) -> None:
+        """
+        Generates and restructures the treasures of a placeholder hollow, does nothing otherwise.
+
+        Complexity:
+            Best Case Complexity: O(1) when the hollow already holds its treasures.
+            Worst Case Complexity: O(gen_treasures + restructure_hollow)
+        """
+        if self.treasure_seed is None:
+            return
+        # a replacement gen_treasures may take no generator, it then draws from wherever it likes
+        gen_treasures = self.gen_treasures
+        if signature(gen_treasures).parameters:
+            self.treasures = gen_treasures(RandomGen(self.treasure_seed))
+        else:
+            self.treasures = gen_treasures()
         self.restructure_hollow()
 
+    @property
+    def treasures(self) -> List[Treasure]:
+        """
+        The treasures currently held by this hollow, built from the table on request.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures in the hollow
+        """
+        return [self.table.treasure(row) for row in self._held_rows()]
+
+    @treasures.setter
+    def treasures(self, treasures: List[Treasure]) -> None:
+        """
+        Stores a new set of treasures in the table, `restructure_hollow` must be called afterwards.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures given
+        """
+        self.treasure_seed = None
+        self.treasure_rows: range = self.table.extend(treasures)
+        self.rows_by_treasure: dict[Treasure, List[int]] | None = None
+        self.treasures_heap: KeyedMaxHeap[int] | None = None
+
+    def _held_rows(self) -> List[int]:
+        """
+        Returns the table rows of the treasures still in this hollow.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures the hollow was given
+        """
+        self._materialise()
+        held = self.table.held
+        return [row for row in self.treasure_rows if held[row]]
+
+    def _find_row(self, treasure: Treasure) -> int | None:
+        """
+        Finds the row of a treasure still held by this hollow.
+        A held treasure handed out by a table is found through its uid, any other treasure
+        through a dictionary, built on the first such lookup, from each treasure to all of its
+        equal rows, so an equal treasure is still found once one of them is removed.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N) for the first lookup of a treasure without a held uid,
+            where N is the number of treasures the hollow was given, O(K) afterwards
+            where K is the number of treasures equal to it.
+        """
+        self._materialise()
+        held = self.table.held
+        row: int | None = treasure.uid
+        if row is not None and row in self.treasure_rows and held[row] and self.table.matches(row, treasure):
+            return row
+        if self.rows_by_treasure is None:
+            self.rows_by_treasure = {}
+            for row in self.treasure_rows:
+                self.rows_by_treasure.setdefault(self.table.treasure(row), []).append(row)
+        for row in self.rows_by_treasure.get(treasure, []):
+            if held[row]:
+                return row
+        return None
+
+    def ranked_rows(self) -> List[int]:
+        """
+        Returns the rows still in the hollow from best to worst value-to-weight ratio,
+        without changing the hollow.
+
+        Complexity:
+            Best Case Complexity: O(N * log(N))
+            Worst Case Complexity: O(N * log(N)) where N is the number of treasures in the hollow
+        """
+        ratios = self.table.ratios
+        rows = self._held_rows()
+        ranking = KeyedMaxHeap.heapify(rows, priorities=[ratios[row] for row in rows])
+        return [ranking.get_max() for _ in range(len(ranking))]
+
+    def remove(self, treasure: Treasure) -> None:
+        """
+        Removes a treasure from the hollow without touching the heap.
+
+        Raises:
+            ValueError: If the treasure is not in the hollow.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(_find_row)
+        """
+        row = self._find_row(treasure)
+        if row is None:
+            raise ValueError(f"{treasure} is not in the hollow")
+        self.table.held[row] = 0
+
+    def _build_heap(self) -> None:
+        """
+        Re-arranges the rows this hollow owns into a KeyedMaxHeap, based on value-to-weight ratio.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures in the hollow
+        """
+        self._materialise()
+        ratios, held = self.table.ratios, self.table.held
+        rows = [row for row in self.treasure_rows if held[row]]
+        self.treasures_heap = KeyedMaxHeap.heapify(rows, priorities=[ratios[row] for row in rows])
+
+    def _take_optimal(self, backpack_capacity: int) -> Treasure | None:
+        """
+        Removes the treasure with the best value-to-weight ratio that fits in the backpack.
+        Treasures that are too heavy stay in the hollow.
+
+        Complexity:
+            Best Case Complexity: O(log(N)) when the best treasure fits.
+            Worst Case Complexity: O(N * log(N)) when no treasure fits.
+            Where N is the number of treasures in the hollow.
+        """
+        self._materialise()
+        weights, held, ratios = self.table.weights, self.table.held, self.table.ratios
+        skipped: List[int] = []
+        taken: int | None = None
+        while len(self.treasures_heap) > 0:
+            row = self.treasures_heap.get_max()
+            if not held[row]:
+                continue  # removed through remove(), drop the stale entry
+            if weights[row] <= backpack_capacity:
+                taken = row
+                break
+            skipped.append(row)
+
+        self.treasures_heap.extend(skipped, [ratios[row] for row in skipped])
+        if taken is None:
+            return None
+        held[taken] = 0
+        return self.table.treasure(taken)
+
     @staticmethod
-    def gen_treasures() -> List[Treasure]:
+    def gen_treasures(gen: RandomGen | type[RandomGen] = RandomGen) -> List[Treasure]:
         """
         This is done here, so we can replace it later on in the auto marker.
         This method contains the logic to generate treasures for the hollows.
 
+        Args:
+            gen (RandomGen | type[RandomGen]): The generator to draw from, the hollow's own substream when materialised
+
         Returns:
             List[Treasure]: A list of treasures that can be found in the maze
         """
-        return generate_treasures()
+        return generate_treasures(gen)
 
     @abstractmethod
     def restructure_hollow(self):
@@ -45,34 +221,48 @@ class Hollow(ABC):
     def get_optimal_treasure(self, backpack_capacity: int) -> Treasure | None:
         pass
 
+    def __contains__(self, treasure: object) -> bool:
+        """
+        Complexity:
+            O(_find_row)
+        """
+        return isinstance(treasure, Treasure) and self._find_row(treasure) is not None
+
     def __len__(self) -> int:
         """
         After the restructure_hollow method is called, the treasures attribute should be updated
         don't create an additional attribute to store the number of treasures in the hollow.
+
+        The count comes from the `held` flags of the rows this hollow owns, as removals are lazy in the heap.
+
+        Complexity:
+            O(N) where N is the number of treasures the hollow was given, counted at C speed
         """
-        return len(self.treasures)
+        self._materialise()
+        return self.table.count_held(self.treasure_rows)
 
 
 class SpookyHollow(Hollow):
     def restructure_hollow(self) -> None:
         """
         Re-arranges the treasures into a MaxHeap, based on value-to-weight ratio.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures in the hollow
         """
-        treasures_with_ratios = [(-t.value / t.weight, t) for t in self.treasures]
-        self.treasures_heap = MaxHeap.heapify(treasures_with_ratios)
-        self.restructured_treasures = treasures_with_ratios  # Track remaining treasures
+        self._build_heap()
 
     def get_optimal_treasure(self, backpack_capacity: int) -> Union[Treasure, None]:
         """
         Removes the treasure with the best value-to-weight ratio that fits in the player's backpack.
+
+        Complexity:
+            Best Case Complexity: O(log(N)) when the best treasure fits.
+            Worst Case Complexity: O(N * log(N)) when no treasure fits.
+            Where N is the number of treasures in the hollow.
         """
-        while len(self.treasures_heap) > 0:
-            ratio, treasure = self.treasures_heap.get_max()  # Extract the max treasure
-            if treasure.weight <= backpack_capacity:
-                # Ensure treasure is in the list before removing
-                self.restructured_treasures.remove((ratio, treasure))  # Remove from the hollow
-                return treasure  # Return the treasure that fits
-        return None  # Return None if no treasure fits
+        return self._take_optimal(backpack_capacity)
 
     def __str__(self) -> str:
         return Tiles.SPOOKY_HOLLOW.value
@@ -85,32 +275,27 @@ class MysticalHollow(Hollow):
     def restructure_hollow(self) -> None:
         """
         Re-arranges the treasures into a MaxHeap, based on value-to-weight ratio.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures in the hollow
         """
-        self.treasures_heap = MaxHeap.heapify([(-t.value / t.weight, t) for t in self.treasures])
-        self.restructured_treasures = self.treasures.copy()  # Keep track of all treasures
+        self._build_heap()
 
     def get_optimal_treasure(self, backpack_capacity: int) -> Union[Treasure, None]:
         """
         Removes the treasure with the best value-to-weight ratio that fits in the player's backpack.
-        """
-        while len(self.treasures_heap) > 0:
-            ratio, treasure = self.treasures_heap.get_max()  # Extract the max treasure
-            if treasure.weight <= backpack_capacity:
-                # Ensure treasure is removed from both current hollow and heap
-                if treasure in self.restructured_treasures:
-                    self.restructured_treasures.remove(treasure)
-                
-                # Remove the treasure from the heap without affecting others
-                treasures_with_ratios = [(t.value / t.weight, t) for t in self.treasures if t != treasure]
-                self.treasures_heap = MaxHeap.heapify(treasures_with_ratios)
-                
-                return treasure
-        return None  # Return None if no treasure fits
-
+        All mystical hollows in a maze share one instance, so the treasure is gone from every one of them.
 
+        Complexity:
+            Best Case Complexity: O(log(N)) when the best treasure fits.
+            Worst Case Complexity: O(N * log(N)) when no treasure fits.
+            Where N is the number of treasures in the hollow.
+        """
+        return self._take_optimal(backpack_capacity)
 
     def __str__(self) -> str:
-        return Tiles.MYSTICAL_HOWL.value
+        return Tiles.MYSTICAL_HOLLOW.value
 
     def __repr__(self) -> str:
         return str(self)
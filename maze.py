@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from config import Directions, Tiles
 from hollows import Hollow, MysticalHollow, SpookyHollow
-from treasure import Treasure
+from treasure import Treasure, TreasureTable
 
 
 class Position:
@@ -21,6 +21,9 @@ class Position:
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Position) and value.row == self.row and value.col == self.col
 
+    def __hash__(self) -> int:
+        return hash((self.row, self.col))
+
     def __repr__(self):
         return str(self)
 
@@ -70,8 +73,66 @@ class Maze:
         self.end_positions: List[Position] = end_positions
         self.rows: int = rows
         self.cols: int = cols
+        self.hollow_positions: List[Position] = []
+        self.hollows_by_position: dict[Position, Hollow] = {}
+        self.hollows_by_type: dict[type, List[Position]] = {}
         self.grid: List[List[MazeCell]] = self._create_grid(walls, hollows, end_positions)
 
+    def _index_hollows(self, grid: List[List[MazeCell]], hollows: List[tuple[Hollow, Position]]) -> None:
+        """
+        Records the hollows left on the grid by position and by type, in row-major order whatever
+        the order they were given in, so later hollow operations do not need to scan the grid.
+        The positions are bucketed by column and then, stably, by row.
+        The index reflects the grid as built, tiles replaced afterwards are not tracked.
+
+        Complexity:
+            Best Case Complexity: O(H + R + C) where H is the number of hollows given,
+            R the number of rows and C the number of columns.
+            Worst Case Complexity: O(H + R + C)
+
+            Assuming dictionary operations can be done on O(1) time.
+        """
+        by_col: List[List[Position]] = [[] for _ in range(self.cols)]
+        for hollow, pos in hollows:
+            if grid[pos.row][pos.col].tile is not hollow or pos in self.hollows_by_position:
+                continue  # covered by an exit, or by a later hollow at the same position
+            self.hollows_by_position[pos] = hollow
+            by_col[pos.col].append(pos)
+
+        by_row: List[List[Position]] = [[] for _ in range(self.rows)]
+        for column in by_col:
+            for pos in column:
+                by_row[pos.row].append(pos)
+        for row in by_row:
+            for pos in row:
+                self.hollow_positions.append(pos)
+                self.hollows_by_type.setdefault(type(self.hollows_by_position[pos]), []).append(pos)
+
+    def hollow_at(self, position: Position) -> Hollow | None:
+        """
+        Returns the hollow at the given position, or None if there is no hollow there.
+
+        Complexity:
+            O(1) assuming dictionary operations can be done in O(1) time.
+        """
+        return self.hollows_by_position.get(position)
+
+    def iter_hollows(self, hollow_type: type | None = None) -> Iterator[Tuple[Position, Hollow]]:
+        """
+        Iterates over the hollows in row-major order, optionally only those of one type.
+        The shared mystical hollow is yielded once for every position it occupies.
+
+        Args:
+            hollow_type (type | None): Only yield hollows of exactly this type.
+
+        Complexity:
+            Best Case Complexity: O(H) where H is the number of hollows yielded.
+            Worst Case Complexity: O(H) where H is the number of hollows yielded.
+        """
+        positions = self.hollow_positions if hollow_type is None else self.hollows_by_type.get(hollow_type, [])
+        for position in positions:
+            yield position, self.hollows_by_position[position]
+
     def _create_grid(self, walls: List[Position], hollows: List[(Hollow, Position)], end_positions: List[Position]) -> List[List[MazeCell]]:
         """
         Args:
@@ -96,6 +157,7 @@ class Maze:
             grid[pos.row][pos.col].tile = hollow
         for end_position in end_positions:
             grid[end_position.row][end_position.col].tile = Tiles.EXIT.value
+        self._index_hollows(grid, hollows)
         return grid
 
     @staticmethod
@@ -162,10 +224,12 @@ class Maze:
             Worst Case Complexity: O(N) where N is the number of cells in the maze.
 
             For small mazes we assume the lists we not need to resize.
+            Hollows are placeholders until first used, so no treasures are generated here.
         """
         cls.validate_maze_file(maze_name)
         end_positions, walls, hollows = [], [], []
-        mystical_hollow: MysticalHollow = MysticalHollow()
+        table: TreasureTable = TreasureTable()
+        mystical_hollow: MysticalHollow = MysticalHollow(table)
         start_position: Position | None = None
         with open(f"./mazes/{maze_name}", 'r') as f:
             lines: List[str] = f.readlines()
@@ -180,7 +244,7 @@ class Maze:
                     elif tile == Tiles.WALL.value:
                         walls.append(Position(i, j))
                     elif tile == Tiles.SPOOKY_HOLLOW.value:
-                        hollows.append((SpookyHollow(), Position(i, j)))
+                        hollows.append((SpookyHollow(table), Position(i, j)))
                     elif tile == Tiles.MYSTICAL_HOLLOW.value:
                         hollows.append((mystical_hollow, Position(i, j)))
         assert start_position is not None
@@ -257,25 +321,96 @@ class Maze:
 
 
     def take_treasures(self, path: List[MazeCell], backpack_capacity: int) -> List[Treasure] | None:
+        """
+        Walks along the path taking the best fitting treasure from every hollow visited.
+        All mystical hollows share one instance, so a treasure taken from one is gone from all of them.
+
+        Args:
+            path (List[MazeCell]): The cells visited, in order.
+            backpack_capacity (int): The weight the backpack can carry.
+
+        Returns:
+            List[Treasure] | None - The treasures taken in order, or None if nothing was taken.
+
+        Complexity:
+            Best Case Complexity: O(P) when the path visits no hollows.
+            Worst Case Complexity: O(P * N * log(N)) where P is the length of the path
+            and N is the largest number of treasures in a hollow.
+        """
         collected_treasures = []
         current_capacity = backpack_capacity
 
         for cell in path:
             if isinstance(cell.tile, Hollow):
                 treasure = cell.tile.get_optimal_treasure(current_capacity)
-                if treasure and treasure.weight <= current_capacity:
-                    # Remove the treasure from all mystical hollows
-                    for hollow in self.grid:
-                        if isinstance(hollow, MysticalHollow):
-                            if treasure in hollow.treasures:
-                                hollow.treasures.remove(treasure)
+                if treasure is not None:
                     collected_treasures.append(treasure)
                     current_capacity -= treasure.weight
 
         return collected_treasures if collected_treasures else None
 
+    def preview_treasures(self, path: List[MazeCell], backpack_capacities: List[int]) -> List[List[Treasure] | None]:
+        """
+        Works out what `take_treasures` would return for each backpack capacity, without
+        taking anything from the hollows.
+
+        The hollows on the path are ranked once and the ranking is shared by every capacity,
+        each capacity then only walks the path against its own record of taken rows.
+
+        Args:
+            path (List[MazeCell]): The cells visited, in order.
+            backpack_capacities (List[int]): The backpack capacities to evaluate.
+
+        Returns:
+            List[List[Treasure] | None] - The result for each capacity, in the order given.
+
+        Complexity:
+            Best Case Complexity: O(P + H * N * log(N) + C) when every capacity is the same.
+            Worst Case Complexity: O(P + H * N * log(N) + C * V * N) where P is the length of the path,
+            H the number of distinct hollows on it, V the number of hollow visits, N the largest
+            number of treasures in a hollow and C the number of capacities.
+        """
+        rankings: dict[int, List[int]] = {}
+        visits: List[Tuple[Hollow, List[int]]] = []
+        for cell in path:
+            if isinstance(cell.tile, Hollow):
+                hollow = cell.tile
+                if id(hollow) not in rankings:
+                    rankings[id(hollow)] = hollow.ranked_rows()
+                visits.append((hollow, rankings[id(hollow)]))
+
+        results: dict[int, List[Treasure] | None] = {}
+        for capacity in backpack_capacities:
+            if capacity not in results:
+                results[capacity] = self._preview_capacity(visits, capacity)
+        return [results[capacity] for capacity in backpack_capacities]
+
+    @staticmethod
+    def _preview_capacity(visits: List[Tuple[Hollow, List[int]]], backpack_capacity: int) -> List[Treasure] | None:
+        """
+        Replays `take_treasures` for one capacity over pre-ranked hollow visits.
+
+        Complexity:
+            Best Case Complexity: O(V) when the best treasure of every visit fits.
+            Worst Case Complexity: O(V * N) where V is the number of hollow visits and
+            N the largest number of treasures in a hollow.
+        """
+        collected_treasures = []
+        current_capacity = backpack_capacity
+        # rows only identify a treasure within one table, and hollows may each have their own
+        taken: set[Tuple[int, int]] = set()
+        for hollow, ranking in visits:
+            table_id = id(hollow.table)
+            weights = hollow.table.weights
+            for row in ranking:
+                if (table_id, row) not in taken and weights[row] <= current_capacity:
+                    taken.add((table_id, row))
+                    collected_treasures.append(hollow.table.treasure(row))
+                    current_capacity -= weights[row]
+                    break
+
+        return collected_treasures if collected_treasures else None
 
-    
     def __repr__(self) -> str:
         return str(self)
 
@@ -6,16 +6,41 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
-from typing import List, TypeVar
+from array import array
+from functools import update_wrapper
+from types import MethodType
+from typing import Callable, List, Tuple, TypeVar
+
+try:
+    import numpy
+except ImportError:  # bulk draws fall back to a pure Python loop
+    numpy = None
 
 T = TypeVar('T')
 
 
+class hybridmethod:
+    """
+    Method decorator binding to the class when looked up on the class and to the instance
+    when looked up on an instance, so `RandomGen.random()` keeps drawing from the class-level
+    default stream while `RandomGen(seed).random()` draws from the instance's own stream.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        update_wrapper(self, func)
+
+    def __get__(self, instance, owner) -> Callable:
+        return MethodType(self.func, owner if instance is None else instance)
+
+
 class RandomGen:
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
 
     Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    Every method can be called on the class, which uses the shared default stream stored in the
+    class attribute `seed`, or on an instance, which has a stream of its own.
 
     Usage:
     ```
@@ -23,55 +48,210 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+
+    gen = RandomGen(123)         # Independent generator, same numbers as the class after set_seed(123)
+    gen.jump(1000)               # Skips 1000 numbers in O(log 1000)
+    workers = [gen.substream(i) for i in range(4)]  # Non-overlapping streams of STREAM_LENGTH numbers
+    gen.randints(1, 10, 500)     # array of the next 500 randint(1, 10), drawn in bulk
     ```
     """
 
     MOD = pow(2, 48)
     A = 25214903917
     C = 11
+    # Numbers in each substream, leaving room for MOD // STREAM_LENGTH streams in one period.
+    STREAM_LENGTH = pow(2, 32)
+    # Bulk draws use NumPy for at least BULK_THRESHOLD numbers, computing BULK_BLOCK states at a time.
+    BULK_THRESHOLD = 256
+    BULK_BLOCK = 4096
+    _block_coefficients = None
 
     seed = time.time_ns()
 
-    @classmethod
-    def set_seed(cls, seed=None) -> None:
+    def __init__(self, seed=None) -> None:
+        """Creates a generator with its own stream, seeded like `set_seed`."""
+        self.set_seed(seed)
+
+    @hybridmethod
+    def set_seed(self, seed=None) -> None:
         """Seed all future calls to `random`."""
         seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        self.seed = seed
 
-    @classmethod
-    def random(cls) -> int:
+    @hybridmethod
+    def random(self) -> int:
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
 
-    @classmethod
-    def random_float(cls) -> float:
+    @hybridmethod
+    def random_float(self) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return self.random() / (1 << 32)
 
-    @classmethod
-    def randint(cls, lo, hi) -> int:
+    @hybridmethod
+    def randint(self, lo, hi) -> int:
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return (self.random() % (hi - lo + 1)) + lo
 
-    @classmethod
-    def random_chance(cls, ratio) -> float:
+    @hybridmethod
+    def random_chance(self, ratio) -> float:
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return self.random_float() < ratio
 
-    @classmethod
-    def random_choice(cls, collection: List[T]) -> T:
+    @hybridmethod
+    def random_choice(self, collection: List[T]) -> T:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return collection[self.randint(0, len(collection)-1)]
 
-    @classmethod
-    def random_shuffle(cls, collection: List) -> None:
+    @hybridmethod
+    def random_shuffle(self, collection: List) -> None:
         """
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(self.random(), i) for i in range(len(collection))]
         positions.sort()  # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
-            collection[x] = tmp[x]
\ No newline at end of file
+            collection[x] = tmp[x]
+
+    @classmethod
+    def jump_coefficients(cls, steps: int) -> Tuple[int, int]:
+        """
+        Returns (a, c) such that `steps` calls to `random` take the state s to (a * s + c) % MOD.
+        Composes the one-step map with itself by repeated squaring.
+        :complexity: O(log steps)
+        """
+        steps %= cls.MOD  # the LCG has full period, so jumping back is jumping forward
+        acc_mult, acc_plus = 1, 0
+        mult, plus = cls.A, cls.C
+        while steps > 0:
+            if steps & 1:
+                acc_mult = acc_mult * mult % cls.MOD
+                acc_plus = (acc_plus * mult + plus) % cls.MOD
+            plus = (mult + 1) * plus % cls.MOD
+            mult = mult * mult % cls.MOD
+            steps >>= 1
+        return acc_mult, acc_plus
+
+    @hybridmethod
+    def jump(self, steps: int) -> None:
+        """
+        Advances the stream as `steps` calls to `random` would, without generating the numbers.
+        A negative number of steps moves the stream back.
+        :complexity: O(log steps)
+        """
+        mult, plus = self.jump_coefficients(steps)
+        self.seed = (mult * self.seed + plus) % self.MOD
+
+    @hybridmethod
+    def substream(self, index: int) -> RandomGen:
+        """
+        Returns a new generator for the `index`-th block of STREAM_LENGTH numbers of this stream,
+        counting from the current state, without advancing this stream. Generators for different
+        indices never produce the same numbers unless one draws more than STREAM_LENGTH of them.
+        :complexity: O(log(index * STREAM_LENGTH))
+        :raises ValueError: if the index does not fit in one period of the LCG
+        """
+        if not 0 <= index < self.MOD // self.STREAM_LENGTH:
+            raise ValueError(f"Substream index should be between 0 and {self.MOD // self.STREAM_LENGTH - 1}.")
+        mult, plus = self.jump_coefficients(index * self.STREAM_LENGTH)
+        return RandomGen((mult * self.seed + plus) % self.MOD)
+
+    @hybridmethod
+    def split(self) -> RandomGen:
+        """
+        Returns a generator for the next block of STREAM_LENGTH numbers and skips this stream past it,
+        so successive calls hand out non-overlapping streams in a reproducible order.
+        :complexity: O(log STREAM_LENGTH)
+        """
+        child = self.substream(0)
+        self.jump(self.STREAM_LENGTH)
+        return child
+
+    @classmethod
+    def block_coefficients(cls) -> Tuple:
+        """
+        Returns NumPy arrays (a, c) with (a[i] * s + c[i]) % MOD the state after i + 1 steps from s,
+        for i below BULK_BLOCK. Computed once and shared.
+        :complexity: O(BULK_BLOCK) on the first call, O(1) after
+        """
+        if cls._block_coefficients is None:
+            mults, plus = [cls.A], [cls.C]
+            for _ in range(cls.BULK_BLOCK - 1):
+                mults.append(mults[-1] * cls.A % cls.MOD)
+                plus.append((plus[-1] * cls.A + cls.C) % cls.MOD)
+            RandomGen._block_coefficients = (numpy.array(mults, dtype=numpy.uint64),
+                                             numpy.array(plus, dtype=numpy.uint64))
+        return cls._block_coefficients
+
+    @hybridmethod
+    def _outputs(self, n: int):
+        """
+        Returns the next n results of `random`, leaving the stream where n calls would.
+        Large draws with NumPy compute each block of states from the state before it in one
+        vectorised step; products wrap modulo 2^64, and masking to 48 bits gives the state
+        modulo MOD because MOD divides 2^64.
+        :complexity: O(n)
+        """
+        state = self.seed % self.MOD
+        if numpy is None or n < self.BULK_THRESHOLD:
+            mult, plus, mask = self.A, self.C, self.MOD - 1
+            outputs = [0] * n
+            for i in range(n):
+                state = (mult * state + plus) & mask
+                outputs[i] = state >> 16
+            self.seed = state
+            return outputs
+
+        mults, plus = self.block_coefficients()
+        mask = numpy.uint64(self.MOD - 1)
+        states = numpy.empty(n, dtype=numpy.uint64)
+        for start in range(0, n, self.BULK_BLOCK):
+            count = min(self.BULK_BLOCK, n - start)
+            states[start:start + count] = (mults[:count] * numpy.uint64(state) + plus[:count]) & mask
+            state = int(states[start + count - 1])
+        self.seed = state
+        return states >> numpy.uint64(16)
+
+    @hybridmethod
+    def randints(self, lo: int, hi: int, n: int) -> array:
+        """
+        Returns an array('q') of n random integers from `lo` to `hi` inclusive,
+        the same numbers as n calls to `randint`.
+        :pre: lo and hi fit in a signed 64-bit integer
+        :complexity: O(n)
+        :raises ValueError: if hi is less than lo, before drawing anything
+        """
+        if hi < lo:
+            raise ValueError(f"Upper bound {hi} should not be less than lower bound {lo}.")
+        span = hi - lo + 1
+        outputs = self._outputs(n)
+        if isinstance(outputs, list):
+            return array('q', [output % span + lo for output in outputs])
+        values = (outputs % numpy.uint64(span)).astype(numpy.int64) + lo
+        return array('q', values.tobytes())
+
+    @hybridmethod
+    def random_floats(self, n: int) -> array:
+        """
+        Returns an array('d') of n random floats in the range 0 to 1,
+        the same numbers as n calls to `random_float`.
+        :complexity: O(n)
+        """
+        outputs = self._outputs(n)
+        if isinstance(outputs, list):
+            return array('d', [output / (1 << 32) for output in outputs])
+        return array('d', (outputs.astype(numpy.float64) / float(1 << 32)).tobytes())
+
+    @hybridmethod
+    def random_chances(self, ratio: float, n: int) -> bytearray:
+        """
+        Returns a bytearray of n flags, 1 where `random_chance(ratio)` would return True.
+        :complexity: O(n)
+        """
+        floats = self.random_floats(n)
+        if numpy is None or n < self.BULK_THRESHOLD:
+            return bytearray([value < ratio for value in floats])
+        return bytearray((numpy.frombuffer(floats, dtype=numpy.float64) < ratio).astype(numpy.uint8).tobytes())
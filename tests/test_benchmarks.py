@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List
+from unittest import TestCase
+
+from benchmarks.suite import Measurement, Regression, compare, fit_exponent
+from ed_utils.decorators import number, visibility
+
+
+def timings(case: str, sizes: List[int], seconds_per_size) -> List[Measurement]:
+    return [Measurement(case, size, seconds_per_size(size), 1e9 * seconds_per_size(size) / size) for size in sizes]
+
+
+class TestBenchmarks(TestCase):
+    @number("5.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fit_exponent(self) -> None:
+        sizes: List[int] = [100, 1000, 10000]
+        self.assertAlmostEqual(fit_exponent(timings("linear", sizes, lambda n: 3e-8 * n)), 1.0)
+        self.assertAlmostEqual(fit_exponent(timings("quadratic", sizes, lambda n: 1e-9 * n * n)), 2.0)
+        n_log_n: float = fit_exponent(timings("n log n", sizes, lambda n: 1e-8 * n * math.log(n)))
+        self.assertTrue(1.0 < n_log_n < 1.2, "Expected n log n to fit slightly above 1")
+        self.assertTrue(math.isnan(fit_exponent(timings("single", [100], lambda n: 1e-6))))
+
+    @number("5.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compare_thresholds(self) -> None:
+        baseline: dict = {
+            "measurements": [{"case": "heap.add", "size": size, "seconds": size * 1e-7, "ns_per_op": 100.0}
+                             for size in (100, 1000, 10000)],
+            "exponents": {"heap.add": 1.0, "bst.insert": 1.1},
+        }
+        measurements: List[Measurement] = [
+            Measurement("heap.add", 100, 1.25e-5, 125.0),     # exactly at the threshold
+            Measurement("heap.add", 1000, 1.3e-4, 130.0),     # past it
+            Measurement("heap.add", 100000, 1e-1, 1000.0),    # no baseline for this size
+            Measurement("bst.insert", 100, 1e-3, 10000.0),    # no baseline for this case
+        ]
+        exponents: Dict[str, float] = {"heap.add": 1.15, "bst.insert": 1.3, "avl.insert": 3.0}
+
+        regressions: List[Regression] = compare(measurements, exponents, baseline, 0.25, 0.15)
+        self.assertEqual([r.case for r in regressions], ["heap.add", "bst.insert"])
+        self.assertTrue(regressions[0].detail.startswith("n=1000:"), "Expected only the size more than 25% slower to be flagged")
+        self.assertIn("1.30 vs 1.10", regressions[1].detail, "Expected only the exponent grown by more than 0.15 to be flagged")
+
+        self.assertEqual(compare(measurements, exponents, baseline, 0.5, 0.5), [], "Expected looser thresholds to pass")
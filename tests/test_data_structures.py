@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from random import Random
+from typing import List
+from unittest import TestCase
+
+from betterbst import BetterBST
+from data_structures.array_stack import ArrayStack
+from data_structures.bst import BinarySearchTree, BSTInOrderIterator, post_order, pre_order
+from data_structures.eytzinger import FrozenBST
+from data_structures.heap import IndexedMaxHeap, KeyedMaxHeap, MaxHeap
+from data_structures.persistent_bst import PersistentBST
+from data_structures.referential_array import ArrayR, NumericArray
+from ed_utils.decorators import number, visibility
+
+
+class TestDataStructures(TestCase):
+    @number("4.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_resizable_heap(self) -> None:
+        heap: MaxHeap[int] = MaxHeap(1, resizable=True)
+        numbers: List[int] = list(range(100))
+        Random(7).shuffle(numbers)
+        for x in numbers:
+            heap.add(x)
+        self.assertEqual(len(heap), 100, "Expected the heap to grow past its initial capacity")
+        self.assertLess(heap.capacity(), 256, "Expected the heap to grow geometrically")
+
+        results: List[int] = [heap.get_max() for _ in range(95)]
+        self.assertEqual(results, list(range(99, 4, -1)), "Expected elements in descending order")
+        self.assertLessEqual(heap.capacity(), 4 * len(heap), "Expected the heap to shrink as it empties")
+
+        fixed: MaxHeap[int] = MaxHeap(2)
+        fixed.add(1)
+        fixed.add(2)
+        self.assertRaises(IndexError, fixed.add, 3)
+
+    @number("4.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_heapify_take_ownership(self) -> None:
+        points: List[int] = [3, 9, 1, 7, 5]
+        heap: MaxHeap[int] = MaxHeap.heapify(points, take_ownership=True)
+        self.assertIs(heap.the_array, points, "Expected the heap to reuse the given list")
+        self.assertEqual([heap.get_max() for _ in range(5)], [9, 7, 5, 3, 1])
+
+        heap = MaxHeap.heapify([], resizable=True, take_ownership=True)
+        heap.add(4)
+        self.assertEqual(heap.get_max(), 4, "Expected an empty owned heap to grow when resizable")
+
+    @number("4.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_keyed_heap(self) -> None:
+        class Unordered:
+            def __init__(self, weight: float) -> None:
+                self.weight = weight
+
+        elements: List[Unordered] = [Unordered(w) for w in [2.5, 9.0, 2.5, 4.0, 1.0]]
+        heap: KeyedMaxHeap[Unordered] = KeyedMaxHeap.heapify(elements, key=lambda e: e.weight, resizable=True)
+        heap.add(Unordered(9.0))
+        heap.add(Unordered(3.0), priority=100.0)
+        self.assertEqual(heap.max_priority(), 100.0, "Expected an explicit priority to be used")
+        weights: List[float] = [heap.get_max().weight for _ in range(len(heap))]
+        self.assertEqual(weights, [3.0, 9.0, 9.0, 4.0, 2.5, 2.5, 1.0], "Expected elements by priority, with ties allowed")
+
+        rows: KeyedMaxHeap[int] = KeyedMaxHeap.heapify([10, 11, 12], priorities=[0.5, 1.5, 1.0])
+        self.assertEqual([rows.get_max() for _ in range(3)], [11, 12, 10])
+
+    @number("4.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_indexed_heap(self) -> None:
+        heap: IndexedMaxHeap[str] = IndexedMaxHeap(1, resizable=True)
+        handles: dict[str, int] = {name: heap.add(name, priority) for name, priority in
+                                   [("a", 5.0), ("b", 1.0), ("c", 3.0), ("d", 4.0), ("e", 2.0)]}
+        heap.update_priority(handles["b"], 10.0)
+        heap.update_priority(handles["a"], 0.5)
+        self.assertEqual(heap.remove(handles["d"]), "d", "Expected remove to return the element")
+        self.assertFalse(heap.contains(handles["d"]), "Expected a removed handle to be gone")
+        self.assertRaises(KeyError, heap.remove, handles["d"])
+        self.assertEqual(heap.priority(handles["c"]), 3.0)
+        self.assertEqual([heap.get_max() for _ in range(len(heap))], ["b", "c", "e", "a"])
+
+        rng: Random = Random(3)
+        heap = IndexedMaxHeap.heapify(list(range(200)), key=float)
+        live: dict[int, float] = {i: float(i) for i in range(200)}
+        for _ in range(300):
+            handle: int = rng.choice(list(live))
+            if rng.random() < 0.3:
+                heap.remove(handle)
+                del live[handle]
+            else:
+                live[handle] = rng.uniform(-100, 300)
+                heap.update_priority(handle, live[handle])
+        popped: List[float] = []
+        while len(heap) > 0:
+            popped.append(heap.priority(heap.peek_handle()))
+            heap.get_max()
+        self.assertEqual(popped, sorted(live.values(), reverse=True), "Expected the heap order to survive updates and removals")
+
+        heap = IndexedMaxHeap(1, resizable=True)
+        a, b = heap.add("a", 5.0), heap.add("b", 1.0)
+        self.assertEqual(heap.push_pop("z", 9.0), ("z", 2), "Expected a new maximum to come straight back")
+        self.assertFalse(heap.contains(2))
+        popped_elt, c = heap.push_pop("c", 3.0)
+        self.assertEqual(popped_elt, "a")
+        self.assertFalse(heap.contains(a), "Expected the popped maximum to lose its handle")
+        popped_elt, d = heap.replace("d", 0.5)
+        self.assertEqual(popped_elt, "c")
+        self.assertEqual((heap.priority(b), heap.priority(d)), (1.0, 0.5))
+        self.assertRaises(IndexError, IndexedMaxHeap(1).replace, "x", 1.0)
+
+        other: IndexedMaxHeap[str] = IndexedMaxHeap(1, resizable=True)
+        x, y = other.add("x", 7.0), other.add("y", 2.0)
+        other.remove(x)
+        offset: int = heap.merge(other)
+        self.assertEqual(len(other), 1, "Expected merge to leave the other heap unchanged")
+        self.assertFalse(heap.contains(offset + x))
+        heap.update_priority(offset + y, 8.0)
+        self.assertEqual(heap.peek_handle(), offset + y, "Expected merged handles to be renumbered")
+        heap.update_priority(d, 9.0)
+        self.assertEqual([heap.get_max() for _ in range(len(heap))], ["d", "y", "b"])
+
+    @number("4.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_heap_arity(self) -> None:
+        rng: Random = Random(11)
+        numbers: List[int] = [rng.randrange(1000) for _ in range(300)]
+        expected: List[int] = sorted(numbers, reverse=True)
+        for arity in [2, 3, 4, 8]:
+            heap: MaxHeap[int] = MaxHeap.heapify(numbers[:150], resizable=True, arity=arity)
+            for x in numbers[150:]:
+                heap.add(x)
+            self.assertEqual([heap.get_max() for _ in range(len(heap))], expected, f"MaxHeap with arity {arity}")
+
+            keyed: KeyedMaxHeap[int] = KeyedMaxHeap.heapify(numbers, key=float, arity=arity)
+            self.assertEqual([keyed.get_max() for _ in range(len(keyed))], expected, f"KeyedMaxHeap with arity {arity}")
+
+            indexed: IndexedMaxHeap[int] = IndexedMaxHeap.heapify(numbers, key=float, arity=arity)
+            for handle in range(0, 300, 3):
+                indexed.update_priority(handle, -1.0 - handle)
+            popped: List[int] = [indexed.get_max() for _ in range(200)]
+            self.assertEqual(popped, sorted((numbers[i] for i in range(300) if i % 3), reverse=True), f"IndexedMaxHeap with arity {arity}")
+
+        self.assertRaises(ValueError, MaxHeap, 4, arity=1)
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_heap_bulk_operations(self) -> None:
+        heap: MaxHeap[int] = MaxHeap.heapify([5, 1, 9, 3, 7], resizable=True)
+        self.assertEqual(heap.peek(), 9)
+        self.assertEqual(heap.peek_k(3), [9, 7, 5], "Expected the three largest elements")
+        self.assertEqual(heap.peek_k(10), [9, 7, 5, 3, 1], "Expected at most every element")
+        self.assertEqual(len(heap), 5, "Expected peeking to leave the heap unchanged")
+
+        self.assertEqual(heap.push_pop(10), 10, "Expected a new maximum to be returned straight away")
+        self.assertEqual(heap.push_pop(4), 9, "Expected the old maximum to be returned")
+        self.assertEqual(heap.replace(0), 7, "Expected replace to return the old maximum")
+
+        other: MaxHeap[int] = MaxHeap.heapify([8, 2, 6])
+        heap.merge(other)
+        self.assertEqual(len(other), 3, "Expected the merged heap to be unchanged")
+        heap.extend([11])
+        heap.extend(range(20, 40))
+        expected: List[int] = sorted([5, 1, 3, 4, 0, 8, 2, 6, 11] + list(range(20, 40)), reverse=True)
+        self.assertEqual([heap.get_max() for _ in range(len(heap))], expected)
+
+        fixed: MaxHeap[int] = MaxHeap(2)
+        self.assertRaises(IndexError, fixed.merge, MaxHeap.heapify([1, 2, 3]))
+
+        keyed: KeyedMaxHeap[str] = KeyedMaxHeap.heapify(["a", "bbb", "cc"], key=len, resizable=True)
+        keyed.extend(["dddd", "e"])
+        self.assertEqual(keyed.peek_k(2), ["dddd", "bbb"])
+        self.assertEqual(keyed.push_pop("ffffff"), "ffffff")
+        self.assertEqual(keyed.replace("gg"), "dddd")
+        keyed.merge(KeyedMaxHeap.heapify(["hhhhh"], key=len))
+        self.assertEqual([len(keyed.get_max()) for _ in range(len(keyed))], [5, 3, 2, 2, 1, 1])
+
+    @number("4.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_bulk_operations(self) -> None:
+        array_r: ArrayR[str] = ArrayR.from_iterable(c for c in "abcde")
+        self.assertEqual(len(array_r), 5)
+        self.assertEqual(array_r[1:4], ["b", "c", "d"], "Expected a slice to be read as a list")
+        array_r[0:2] = ["x", "y"]
+        array_r.resize(7)
+        self.assertEqual(array_r[:], ["x", "y", "c", "d", "e", None, None], "Expected resizing to keep the items")
+        array_r.resize(2)
+        self.assertEqual(array_r[:], ["x", "y"])
+        self.assertRaises(ValueError, ArrayR.from_iterable, [])
+        self.assertEqual(ArrayR(3)[:], [None, None, None], "Expected a new array to hold None")
+
+        numbers: NumericArray = NumericArray(4, 'l')
+        numbers[1:3] = [5, 6]
+        view: memoryview = numbers.view()
+        self.assertEqual(view.tolist(), [0, 5, 6, 0], "Expected the view to share the array's values")
+        numbers[0] = 9
+        self.assertEqual(view[0], 9, "Expected the view not to be a copy")
+        view.release()
+        numbers.resize(6)
+        self.assertEqual(list(numbers[:]), [9, 5, 6, 0, 0, 0])
+        self.assertEqual(NumericArray.from_iterable([0.5, 1.5])[1], 1.5)
+
+    @number("4.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_frozen_bst(self) -> None:
+        keys: List[int] = Random(3).sample(range(0, 3000, 3), 300)
+        tree: BetterBST[int, str] = BetterBST([(x, str(x)) for x in keys])
+        frozen: FrozenBST[int, str] = FrozenBST.from_tree(tree)
+        self.assertEqual(len(frozen), 300)
+        self.assertEqual([key for key, _ in frozen], sorted(keys), "Expected in-order iteration of the slots")
+        for key in keys:
+            self.assertEqual(frozen[key], str(key))
+        self.assertNotIn(keys[0] + 1, frozen)
+        self.assertRaises(KeyError, frozen.__getitem__, -1)
+
+        ordered: List[int] = sorted(keys)
+        self.assertEqual(frozen.floor(ordered[5] + 1), (ordered[5], str(ordered[5])))
+        self.assertEqual(frozen.ceiling(ordered[5] + 1), (ordered[6], str(ordered[6])))
+        self.assertEqual(frozen.floor(ordered[5]), (ordered[5], str(ordered[5])))
+        self.assertIsNone(frozen.floor(ordered[0] - 1))
+        self.assertIsNone(frozen.ceiling(ordered[-1] + 1))
+
+        self.assertIsNone(FrozenBST([]).ceiling(0))
+        self.assertRaises(ValueError, FrozenBST, [(2, "a"), (1, "b")])
+
+    @number("4.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_persistent_bst(self) -> None:
+        rng: Random = Random(6)
+        keys: List[int] = rng.sample(range(1000), 200)
+        tree: PersistentBST[int, int] = PersistentBST()
+        for key in keys:
+            tree[key] = key
+        before: PersistentBST[int, int] = tree.snapshot()
+        readers = iter(tree)
+        first = next(readers)
+
+        removed: List[int] = rng.sample(keys, 100)
+        for key in removed:
+            del tree[key]
+        tree[1000] = 1000
+        self.assertEqual([node.key for node in before], sorted(keys), "Expected the snapshot to be unaffected by writes")
+        self.assertEqual([first.key] + [node.key for node in readers], sorted(keys),
+                         "Expected an iteration to finish on the version it started on")
+        self.assertEqual(len(before), 200)
+        self.assertEqual([node.key for node in tree], sorted(set(keys) - set(removed)) + [1000])
+        self.assertEqual(tree.root.size, len(tree))
+        self.assertEqual(tree.kth(1).key, min(set(keys) - set(removed)))
+
+        shared = tree.insert(-1, -1)
+        self.assertNotIn(-1, tree, "Expected insert to leave the handle on its version")
+        self.assertEqual(shared[-1], -1)
+        self.assertIs(shared.get_maximal(shared.root), tree.get_maximal(tree.root), "Expected untouched nodes to be shared")
+        self.assertEqual(len(tree.delete(1000)), len(tree) - 1)
+        self.assertRaises(ValueError, tree.insert, 1000, 0)
+        self.assertRaises(ValueError, tree.delete, -5)
+        self.assertEqual(len(tree), 101)
+
+        kept: List[int] = [node.key for node in tree]
+        before = tree.snapshot()
+        upper: PersistentBST[int, int] = tree.split(500)
+        self.assertEqual([node.key for node in before], kept, "Expected split to leave earlier versions unchanged")
+        self.assertEqual([node.key for node in tree], [key for key in kept if key < 500])
+        self.assertEqual([node.key for node in upper], [key for key in kept if key >= 500])
+        self.assertEqual((tree.root.size, upper.root.size), (len(tree), len(upper)))
+
+        lower = tree.snapshot()
+        upper_before = upper.snapshot()
+        tree.join(upper)
+        self.assertEqual([node.key for node in tree], kept, "Expected join to restore the split version")
+        self.assertEqual(tree.root.size, len(tree))
+        self.assertEqual((len(upper), upper.root), (0, None), "Expected join to empty the other handle")
+        self.assertEqual([node.key for node in lower], [key for key in kept if key < 500], "Expected join to leave earlier versions unchanged")
+        self.assertEqual([node.key for node in upper_before], [key for key in kept if key >= 500])
+        self.assertEqual([node.key for node in before], kept)
+        self.assertRaises(ValueError, tree.join, lower)
+
+    @number("4.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_array_stack(self) -> None:
+        stack: ArrayStack[int] = ArrayStack()
+        for x in range(20):
+            stack.push(x)
+        self.assertEqual(len(stack), 20)
+        self.assertEqual(stack.peek(), 19)
+        self.assertEqual(stack.pop(), 19)
+        stack.push_many(range(100, 103))
+        self.assertEqual(stack.pop_many(4), [102, 101, 100, 18], "Expected pop_many to pop in pop order")
+        self.assertRaises(Exception, stack.pop_many, 100)
+        self.assertRaises(Exception, stack.pop_many, -1)
+        self.assertEqual((len(stack), stack.peek()), (18, 17), "Expected a rejected pop_many to leave the stack unchanged")
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        self.assertRaises(Exception, stack.pop)
+        self.assertRaises(AttributeError, setattr, stack, "top", None)
+
+        bst: BinarySearchTree[int, int] = BinarySearchTree()
+        keys: List[int] = Random(1).sample(range(100), 30)
+        for key in keys:
+            bst[key] = key
+        shared: ArrayStack = ArrayStack()
+        self.assertEqual([node.key for node in BSTInOrderIterator(bst.root, shared)], sorted(keys))
+        self.assertEqual([node.key for node in pre_order(bst.root, shared)], [node.key for node in pre_order(bst.root)])
+        self.assertEqual([node.key for node in post_order(bst.root, shared)], [node.key for node in post_order(bst.root)])
+        self.assertTrue(shared.is_empty(), "Expected a finished traversal to leave the stack empty")
@@ -5,6 +5,9 @@ from typing import List, Tuple
 from unittest import TestCase
 
 from betterbst import BetterBST
+from data_structures.avl import AVLTree
+from data_structures.bst import (BinarySearchTree, BSTInOrderIterator, BSTPostOrderIterator, BSTPreOrderIterator,
+                                  post_order, pre_order)
 from ed_utils.decorators import number, visibility
 
 
@@ -44,4 +47,213 @@ class TestTask1(TestCase):
         numbers: List[Tuple[int, str]] = [(x, str(x)) for x in numbers]
         better_bst = BetterBST(numbers)
 
-        self.assertEqual(better_bst.is_balanced(), True, "The tree should be balanced")
\ No newline at end of file
+        self.assertEqual(better_bst.is_balanced(), True, "The tree should be balanced")
+
+    @number("1.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bst_sorted_inserts(self) -> None:
+        bst: BinarySearchTree[int, str] = BinarySearchTree()
+        for x in range(2000):
+            bst[x] = str(x)
+        self.assertEqual(len(bst), 2000, "Expected all sorted keys to be inserted")
+        self.assertEqual(bst.get_tree_node_by_key(1999).depth, 2000, "Expected the last key at the bottom of the chain")
+        self.assertEqual(bst[1500], "1500")
+        self.assertEqual(bst.get_maximal(bst.root).key, 1999)
+        self.assertRaises(ValueError, bst.__setitem__, 10, "10")
+
+        for x in range(0, 2000, 2):
+            del bst[x]
+        self.assertEqual(len(bst), 1000, "Expected half of the keys to be deleted")
+        self.assertEqual(bst.get_minimal(bst.root).key, 1)
+        self.assertFalse(4 in bst, "Expected a deleted key to be gone")
+        self.assertRaises(ValueError, bst.__delitem__, 4)
+
+    @number("1.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bst_delete_with_two_children(self) -> None:
+        rng: Random = Random(5)
+        keys: List[int] = rng.sample(range(1000), 300)
+        bst: BinarySearchTree[int, int] = BinarySearchTree()
+        for key in keys:
+            bst[key] = key
+        remaining: set[int] = set(keys)
+        for key in rng.sample(keys, 200):
+            del bst[key]
+            remaining.remove(key)
+        self.assertEqual([node.key for node in bst], sorted(remaining), "Expected the in-order keys to survive deletions")
+
+    @number("1.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_avl_tree(self) -> None:
+        tree: AVLTree[int, str] = AVLTree()
+        for x in range(1, 4097):
+            tree[x] = str(x)
+        self.assertEqual(len(tree), 4096)
+        self.assertTrue(tree.is_balanced(), "Expected sorted inserts to keep the tree balanced")
+        self.assertLessEqual(tree.get_tree_height(), 14, "Expected a logarithmic height after sorted inserts")
+        self.assertEqual(tree.get_minimal(tree.root).key, 1)
+        self.assertEqual(tree.get_maximal(tree.root).key, 4096)
+
+        rng: Random = Random(9)
+        for x in rng.sample(range(1, 4097), 3000):
+            del tree[x]
+        self.assertEqual(len(tree), 1096)
+        self.assertTrue(tree.is_balanced(), "Expected deletions to keep the tree balanced")
+        self.assertLessEqual(tree.get_tree_height(), 12)
+        keys: List[int] = [node.key for node in tree]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(tree[keys[0]], str(keys[0]))
+        self.assertRaises(ValueError, tree.__delitem__, 0)
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_better_bst_bulk_build(self) -> None:
+        rng: Random = Random(2)
+        keys: List[int] = rng.sample(range(100000), 1000)
+        elements: List[Tuple[int, str]] = [(x, str(x)) for x in keys]
+        better_bst: BetterBST = BetterBST(elements)
+        self.assertEqual([k for k, _ in elements], keys, "Expected the given list to be left unchanged")
+        self.assertEqual(len(better_bst), 1000)
+        self.assertTrue(better_bst.is_balanced(), "The tree should be balanced")
+        self.assertEqual([node.key for node in better_bst], sorted(keys))
+        for node in better_bst:
+            self.assertEqual(better_bst[node.key], str(node.key))
+            if node.left is not None:
+                self.assertEqual(node.left.depth, node.depth + 1, "Expected depths to be set while linking")
+
+        better_bst = BetterBST([(x, x) for x in range(1000)])
+        self.assertTrue(better_bst.is_balanced(), "Expected sorted input to build a balanced tree")
+        better_bst[1000] = 1000
+        self.assertEqual(better_bst.get_maximal(better_bst.root).key, 1000)
+        self.assertRaises(ValueError, BetterBST, [(1, "a"), (2, "b"), (1, "c")])
+
+    @number("1.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_order_statistics(self) -> None:
+        rng: Random = Random(11)
+        keys: List[int] = rng.sample(range(0, 2000, 2), 400)
+        trees = [BinarySearchTree(), AVLTree(), BetterBST([(x, x) for x in keys])]
+        for tree in trees[:2]:
+            for key in keys:
+                tree[key] = key
+        for tree in trees:
+            self.assertRaises(ValueError, tree.__setitem__, keys[0], 0)
+            for key in rng.sample(keys, 150):
+                del tree[key]
+            remaining: List[int] = sorted(node.key for node in tree)
+            self.assertEqual(tree.root.size, len(tree), "Expected the root size to match the length")
+            for k in (1, 17, len(remaining)):
+                self.assertEqual(tree.kth(k).key, remaining[k - 1])
+            self.assertRaises(IndexError, tree.kth, 0)
+            self.assertRaises(IndexError, tree.kth, len(remaining) + 1)
+            self.assertEqual(tree.rank(remaining[10]), 10)
+            self.assertEqual(tree.rank(remaining[10] + 1), 11, "Expected rank to work for absent keys")
+            self.assertEqual(tree.count_range(500, 1500), sum(1 for key in remaining if 500 <= key < 1500))
+            self.assertEqual(tree.count_range(1500, 500), 0)
+
+    @number("1.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_range_queries(self) -> None:
+        keys: List[int] = list(range(0, 200, 5))
+        Random(4).shuffle(keys)
+        bst: BinarySearchTree[int, str] = BinarySearchTree()
+        for key in keys:
+            bst[key] = str(key)
+        self.assertEqual(bst.floor(42).key, 40)
+        self.assertEqual(bst.floor(45).key, 45)
+        self.assertIsNone(bst.floor(-1), "Expected no floor below the minimal key")
+        self.assertEqual(bst.ceiling(42).key, 45)
+        self.assertEqual(bst.ceiling(0).key, 0)
+        self.assertIsNone(bst.ceiling(196), "Expected no ceiling above the maximal key")
+
+        self.assertEqual(list(bst.range_items(12, 31)), [(15, "15"), (20, "20"), (25, "25"), (30, "30")])
+        self.assertEqual(list(bst.range_items(10, 10)), [])
+        self.assertEqual([key for key, _ in bst.range_items(-100, 1000)], sorted(keys))
+        items = bst.range_items(0, 1000)
+        self.assertEqual(next(items), (0, "0"), "Expected the range to be iterated lazily")
+
+    @number("1.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_merge_split_join(self) -> None:
+        rng: Random = Random(8)
+        keys: List[int] = rng.sample(range(10000), 600)
+        evens: List[Tuple[int, int]] = [(x, x) for x in keys if x % 2 == 0]
+        odds: List[Tuple[int, int]] = [(x, x) for x in keys if x % 2 == 1]
+        merged = BetterBST.merge(BetterBST(evens), BetterBST(odds))
+        self.assertIsInstance(merged, BetterBST)
+        self.assertEqual([node.key for node in merged], sorted(keys))
+        self.assertTrue(merged.is_balanced(), "Expected the merged tree to be balanced")
+        self.assertEqual(merged.root.size, 600)
+        self.assertRaises(ValueError, BetterBST.merge, BetterBST(evens), BetterBST(evens[:1]))
+
+        for cls in (BinarySearchTree, AVLTree, BetterBST):
+            tree = cls()
+            for key in keys:
+                tree[key] = key
+            upper = tree.split(5000)
+            self.assertIsInstance(upper, cls)
+            self.assertEqual([node.key for node in tree], sorted(x for x in keys if x < 5000))
+            self.assertEqual([node.key for node in upper], sorted(x for x in keys if x >= 5000))
+            self.assertEqual(len(tree) + len(upper), 600)
+            self.assertEqual(tree.root.size, len(tree), "Expected sizes to be fixed along the split path")
+            self.assertEqual(upper.kth(1).key, min(x for x in keys if x >= 5000))
+            if cls is AVLTree:
+                self.assertTrue(tree.is_balanced() and upper.is_balanced(), "Expected split AVL trees to stay balanced")
+            self.assertRaises(ValueError, upper.join, tree)
+
+            tree.join(upper)
+            self.assertEqual(len(upper), 0)
+            self.assertEqual([node.key for node in tree], sorted(keys))
+            self.assertEqual(tree.root.size, 600)
+            self.assertEqual(tree.rank(5000), sum(1 for x in keys if x < 5000))
+            if cls is AVLTree:
+                self.assertTrue(tree.is_balanced(), "Expected joined AVL trees to stay balanced")
+
+    @number("1.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_traversals(self) -> None:
+        bst: BinarySearchTree[int, int] = BinarySearchTree()
+        for key in [8, 4, 12, 2, 6, 10, 14, 1, 7, 13]:
+            bst[key] = key
+        self.assertEqual([node.key for node in bst], [1, 2, 4, 6, 7, 8, 10, 12, 13, 14])
+        self.assertEqual([node.key for node in reversed(bst)], [14, 13, 12, 10, 8, 7, 6, 4, 2, 1])
+        self.assertEqual([node.key for node in pre_order(bst.root)], [8, 4, 2, 1, 6, 7, 12, 10, 14, 13])
+        self.assertEqual([node.key for node in post_order(bst.root)], [1, 2, 7, 6, 4, 10, 13, 14, 12, 8])
+        self.assertEqual([node.key for node in BSTPreOrderIterator(bst.root)], [8, 4, 2, 1, 6, 7, 12, 10, 14, 13])
+        self.assertEqual([node.key for node in BSTInOrderIterator(bst.root)], [1, 2, 4, 6, 7, 8, 10, 12, 13, 14])
+        self.assertEqual([node.key for node in BSTPostOrderIterator(bst.root)], [1, 2, 7, 6, 4, 10, 13, 14, 12, 8])
+        self.assertEqual(list(pre_order(None)), [], "Expected an empty tree to yield nothing")
+        self.assertEqual(list(post_order(None)), [])
+
+    @number("1.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shape_stats(self) -> None:
+        self.assertTrue(BinarySearchTree().is_balanced(), "Expected an empty tree to be balanced")
+        self.assertEqual(BinarySearchTree().stats().leaves, 0)
+
+        better_bst: BetterBST = BetterBST([(x, x) for x in range(1, 16)])
+        stats = better_bst.stats()
+        self.assertEqual((stats.height, stats.leaves, stats.max_depth), (4, 8, 4))
+        self.assertAlmostEqual(stats.average_depth, (1 * 1 + 2 * 2 + 4 * 3 + 8 * 4) / 15)
+        self.assertEqual(stats.imbalance_ratio, 1.0)
+        self.assertIs(better_bst.stats(), stats, "Expected the stats to be cached while the tree is unchanged")
+
+        for x in range(1, 16, 2):
+            del better_bst[x]
+        self.assertIsNot(better_bst.stats(), stats)
+        self.assertEqual(better_bst.stats().leaves, 4)
+        for x in (4, 12, 8):
+            del better_bst[x]
+        self.assertEqual([node.key for node in better_bst], [2, 6, 10, 14])
+        self.assertEqual(better_bst.root.height, 3, "Expected heights to follow deletions")
+
+        bst: BinarySearchTree[int, int] = BinarySearchTree()
+        for x in range(1, 9):
+            bst[x] = x
+        self.assertFalse(bst.is_balanced())
+        stats = bst.stats()
+        self.assertEqual((stats.height, stats.leaves), (8, 1))
+        self.assertEqual(stats.imbalance_ratio, 2.0)
+        for x in range(2, 8):
+            del bst[x]
+        self.assertTrue(bst.is_balanced(), "Expected promoted sub-trees to be measured by their real height")
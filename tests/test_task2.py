@@ -5,7 +5,8 @@ from unittest import TestCase
 
 from ed_utils.decorators import number, visibility
 from hollows import Hollow, MysticalHollow, SpookyHollow
-from treasure import Treasure
+from random_gen import RandomGen
+from treasure import Treasure, TreasureTable, generate_treasures
 
 
 class TestTask2(TestCase):
@@ -90,4 +91,150 @@ class TestTask2(TestCase):
         mystical_hollow.get_optimal_treasure(100)
         for _ in range(10):
             self.assertIsNone(mystical_hollow.get_optimal_treasure(1), "Expected None as the only treasures are heavier than provided backpack capacity")
-            self.assertIsNone(mystical_hollow.get_optimal_treasure(0), "Expected None as the only treasures are heavier than provided backpack capacity")
\ No newline at end of file
+            self.assertIsNone(mystical_hollow.get_optimal_treasure(0), "Expected None as the only treasures are heavier than provided backpack capacity")
+
+    @number("2.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_shared_treasure_table(self) -> None:
+        treasures: List[Treasure] = [Treasure(10, 5), Treasure(3, 1), Treasure(8, 8)]
+        def treasure_gen(x): return treasures
+        Hollow.gen_treasures = treasure_gen
+
+        table: TreasureTable = TreasureTable()
+        spooky_hollow: SpookyHollow = SpookyHollow(table)
+        mystical_hollow: MysticalHollow = MysticalHollow(table)
+        self.assertEqual(len(spooky_hollow) + len(mystical_hollow), 2 * len(treasures))
+        self.assertEqual(len(table), 2 * len(treasures), "Expected both hollows to store their treasures in the shared table")
+        self.assertEqual(table.ratios[0], 2.0, "Expected the ratio to be precomputed")
+
+        self.assertEqual(spooky_hollow.get_optimal_treasure(100), Treasure(3, 1))
+        self.assertEqual(len(spooky_hollow), 2, "Expected one treasure to be removed from the spooky hollow")
+        self.assertEqual(len(mystical_hollow), 3, "Expected the mystical hollow to be untouched")
+        self.assertEqual(spooky_hollow.get_optimal_treasure(6), Treasure(10, 5))
+        self.assertEqual(spooky_hollow.treasures, [Treasure(8, 8)], "Expected only the heavy treasure to remain")
+
+    @number("2.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_lazy_hollows_reproducible(self) -> None:
+        Hollow.gen_treasures = staticmethod(generate_treasures)
+
+        RandomGen.set_seed(1234)
+        first: List[SpookyHollow] = [SpookyHollow() for _ in range(3)]
+        self.assertIsNotNone(first[0].treasure_seed, "Expected the hollow to be a placeholder until used")
+        first_treasures: List[List[Treasure]] = [hollow.treasures for hollow in first]
+        self.assertIsNone(first[0].treasure_seed, "Expected the hollow to be generated once used")
+
+        RandomGen.set_seed(1234)
+        second: List[SpookyHollow] = [SpookyHollow() for _ in range(3)]
+        for hollow in reversed(second):
+            self.assertGreater(len(hollow), 0, "Expected the hollow to generate its treasures")
+        second_treasures: List[List[Treasure]] = [hollow.treasures for hollow in second]
+        self.assertEqual(first_treasures, second_treasures, "Expected the same treasures regardless of the order hollows are used in")
+
+        third: SpookyHollow = SpookyHollow()
+        expected: List[Treasure] = generate_treasures(RandomGen(third.treasure_seed))
+        seed_before: int = RandomGen.seed
+        self.assertEqual(set(third.treasures), set(expected), "Expected the hollow to draw from its own substream")
+        self.assertEqual(RandomGen.seed, seed_before, "Expected generation to leave the default stream alone")
+
+    @number("2.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hollow_membership_and_removal(self) -> None:
+        treasures: List[Treasure] = [Treasure(10, 5), Treasure(3, 1), Treasure(8, 8)]
+        def treasure_gen(x): return treasures
+        Hollow.gen_treasures = treasure_gen
+
+        self.assertEqual(hash(Treasure(10, 5)), hash(Treasure(10, 5, uid=7)), "Equal treasures should hash equally")
+        spooky_hollow: SpookyHollow = SpookyHollow()
+        self.assertTrue(Treasure(8, 8) in spooky_hollow, "Expected an equal treasure to be found in the hollow")
+        self.assertFalse(Treasure(8, 9) in spooky_hollow, "Expected an unknown treasure not to be found in the hollow")
+
+        taken: Treasure | None = spooky_hollow.get_optimal_treasure(100)
+        self.assertIsNotNone(taken.uid, "Expected treasures from a hollow to carry their uid")
+        self.assertFalse(taken in spooky_hollow, "Expected a taken treasure to be gone from the hollow")
+        self.assertEqual({taken}, {Treasure(3, 1)}, "Expected treasures to be usable in sets")
+
+        spooky_hollow.remove(Treasure(10, 5))
+        self.assertEqual(len(spooky_hollow), 1, "Expected the removed treasure to no longer be counted")
+        self.assertEqual(spooky_hollow.get_optimal_treasure(100), Treasure(8, 8), "Expected the removed treasure to be skipped")
+        self.assertRaises(ValueError, spooky_hollow.remove, Treasure(10, 5))
+
+    @number("2.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_gen_streams(self) -> None:
+        RandomGen.set_seed(77)
+        expected: List[int] = [RandomGen.randint(1, 1000) for _ in range(50)]
+        gen: RandomGen = RandomGen(77)
+        self.assertEqual([gen.randint(1, 1000) for _ in range(50)], expected, "Expected an instance to match the class stream")
+        self.assertEqual(RandomGen.seed, gen.seed)
+        gen.random()
+        self.assertNotEqual(RandomGen.seed, gen.seed, "Expected the instance to keep its own state")
+
+        walker, jumper = RandomGen(3), RandomGen(3)
+        for _ in range(1000):
+            walker.random()
+        jumper.jump(1000)
+        self.assertEqual(jumper.seed, walker.seed, "Expected a jump to match drawing the numbers")
+        jumper.jump(-1000)
+        self.assertEqual(jumper.seed, 3)
+
+        parent: RandomGen = RandomGen(11)
+        child: RandomGen = parent.split()
+        self.assertEqual(child.seed, 11)
+        self.assertEqual(parent.seed, parent.substream(0).seed)
+        self.assertEqual(RandomGen(11).substream(1).seed, parent.seed, "Expected split to skip past the child's block")
+        self.assertRaises(ValueError, parent.substream, RandomGen.MOD // RandomGen.STREAM_LENGTH)
+
+        Hollow.gen_treasures = staticmethod(generate_treasures)
+        RandomGen.set_seed(1234)
+        hollows: List[SpookyHollow] = [SpookyHollow() for _ in range(3)]
+        RandomGen.set_seed(1234)
+        first: SpookyHollow = SpookyHollow()
+        RandomGen.set_seed(1234)
+        RandomGen.jump(RandomGen.STREAM_LENGTH)  # the second hollow's stream starts one block in
+        second: SpookyHollow = SpookyHollow()
+        self.assertEqual(first.treasures, hollows[0].treasures)
+        self.assertEqual(second.treasures, hollows[1].treasures)
+
+    @number("2.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_gen_bulk_draws(self) -> None:
+        for n in (0, 7, 300, 5000):
+            bulk, scalar = RandomGen(31), RandomGen(31)
+            self.assertEqual(list(bulk.randints(-3, 40, n)), [scalar.randint(-3, 40) for _ in range(n)])
+            self.assertEqual(list(bulk.random_floats(n)), [scalar.random_float() for _ in range(n)])
+            self.assertEqual(list(bulk.random_chances(0.25, n)), [int(scalar.random_chance(0.25)) for _ in range(n)])
+            self.assertEqual(bulk.seed, scalar.seed, "Expected bulk draws to leave the stream where scalar draws do")
+
+        for n in (3, 300):
+            gen: RandomGen = RandomGen(31)
+            self.assertRaises(ValueError, gen.randints, 5, 4, n)
+            self.assertEqual(gen.seed, 31, "Expected invalid bounds to be rejected before drawing")
+
+        RandomGen.set_seed(5)
+        treasures: List[List[Treasure]] = [generate_treasures() for _ in range(20)]
+        seed_after: int = RandomGen.seed
+        RandomGen.set_seed(5)
+        self.assertEqual([generate_treasures() for _ in range(20)], treasures)
+        self.assertEqual(RandomGen.seed, seed_after)
+
+    @number("2.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_equal_treasures(self) -> None:
+        def treasure_gen(x): return [Treasure(5, 1), Treasure(5, 1), Treasure(1, 9)]
+        Hollow.gen_treasures = treasure_gen
+
+        spooky_hollow: SpookyHollow = SpookyHollow()
+        spooky_hollow.remove(Treasure(5, 1))
+        self.assertEqual(len(spooky_hollow), 2)
+        self.assertIn(Treasure(5, 1), spooky_hollow, "Expected the equal treasure to still be in the hollow")
+        spooky_hollow.remove(Treasure(5, 1))
+        self.assertNotIn(Treasure(5, 1), spooky_hollow)
+        self.assertRaises(ValueError, spooky_hollow.remove, Treasure(5, 1))
+
+        spooky_hollow = SpookyHollow()
+        taken: Treasure | None = spooky_hollow.get_optimal_treasure(10)
+        self.assertEqual(taken, Treasure(5, 1))
+        self.assertIn(taken, spooky_hollow, "Expected a taken treasure's uid not to hide an equal held one")
+        spooky_hollow.remove(taken)
+        self.assertEqual(spooky_hollow.treasures, [Treasure(1, 9)])
@@ -5,7 +5,7 @@ from unittest import TestCase
 
 from config import Directions, Tiles
 from ed_utils.decorators import number, visibility
-from hollows import Hollow
+from hollows import Hollow, MysticalHollow, SpookyHollow
 from maze import Maze, MazeCell, Position
 from treasure import Treasure
 
@@ -29,13 +29,8 @@ class TestTask3(TestCase):
         return sum(map(lambda t: t.value, treasures))
 
     def force_hollows(self, treasures: List[List[Treasure]]) -> None:
-        treasure_index: int = 0
-        for row in range(len(self.maze.grid)):
-            for col in range(len(self.maze.grid[row])):
-                maze_cell: MazeCell = self.maze.grid[row][col]
-                if isinstance(maze_cell.tile, Hollow):
-                    self.update_hollow(maze_cell.tile, treasures[treasure_index])
-                    treasure_index += 1
+        for treasure_index, (_, hollow) in enumerate(self.maze.iter_hollows()):
+            self.update_hollow(hollow, treasures[treasure_index])
 
     def validate_path(self, maze: Maze, path: List[Position]) -> bool:
         def valid_step(step: Position) -> bool:
@@ -254,4 +249,62 @@ class TestTask3(TestCase):
 
         student_result: List[Treasure] | None = self.maze.take_treasures(path, 1008)
         expected: List[Treasure] = [Treasure(51, 6), Treasure(96, 13), Treasure(84, 14), Treasure(87, 23), Treasure(70, 19), Treasure(97, 30)]
-        self.assertEqual(student_result, expected, f"Incorrect treasures taken {student_result}, expected {expected}")
\ No newline at end of file
+        self.assertEqual(student_result, expected, f"Incorrect treasures taken {student_result}, expected {expected}")
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_preview_treasures_many_capacities(self) -> None:
+        self.maze: Maze = Maze.load_maze_from_file("/task3/treasures/maze1.txt")
+        path: List[tuple[int, int]] = [(3, 1), (2, 1), (1, 1), (1, 2), (2, 2), (3, 2), (3, 3), (2, 3), (1, 3), (1, 4), (2, 4),
+                                       (3, 4), (3, 5), (2, 5), (1, 5), (1, 6), (2, 6), (3, 6), (3, 7), (2, 7), (1, 7)]
+        path: List[MazeCell] = list(map(lambda p: self.maze.grid[p[0]][p[1]], path))
+        mystic_1: List[Treasure] = [Treasure(41, 42), Treasure(66, 1), Treasure(7, 73), Treasure(56, 51)]
+        spooky_1: List[Treasure] = [Treasure(44, 95), Treasure(60, 38), Treasure(67, 2), Treasure(68, 49)]
+        spooky_2: List[Treasure] = [Treasure(81, 93), Treasure(78, 19), Treasure(34, 3), Treasure(15, 65)]
+        treasures: List[List[Treasure]] = [mystic_1, spooky_1, spooky_2]
+        self.force_hollows(treasures)
+
+        capacities: List[int] = [0, 3, 7, 50, 100, 7, 1000]
+        previews: List[List[Treasure] | None] = self.maze.preview_treasures(path, capacities)
+        self.assertEqual(len(previews), len(capacities), "Expected one result per capacity")
+        for capacity, preview in zip(capacities, previews):
+            self.force_hollows(treasures)
+            expected: List[Treasure] | None = self.maze.take_treasures(path, capacity)
+            self.assertEqual(preview, expected, f"Preview for capacity {capacity} differs from take_treasures")
+
+        self.force_hollows(treasures)
+        self.maze.preview_treasures(path, capacities)
+        hollow_sizes: List[int] = [len(hollow) for _, hollow in self.maze.iter_hollows()]
+        self.assertEqual(hollow_sizes, [4, 4, 4], "Expected previewing not to take any treasures")
+
+        # default-constructed hollows each have a private table, so their rows overlap
+        first, second = SpookyHollow(), SpookyHollow()
+        self.update_hollow(first, [Treasure(10, 1), Treasure(1, 50)])
+        self.update_hollow(second, [Treasure(20, 1), Treasure(2, 50)])
+        self.maze = Maze(Position(0, 0), [Position(0, 3)], [], [(first, Position(0, 1)), (second, Position(0, 2))], 1, 4)
+        path = self.maze.grid[0]
+        preview: List[Treasure] | None = self.maze.preview_treasures(path, [100])[0]
+        self.assertEqual(preview, [Treasure(10, 1), Treasure(20, 1)], "Expected rows of different tables not to clash")
+        self.assertEqual(preview, self.maze.take_treasures(path, 100))
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hollow_index(self) -> None:
+        maze: Maze = Maze.load_maze_from_file("/task3/treasures/maze2.txt")
+        positions: List[Position] = [position for position, _ in maze.iter_hollows()]
+        expected: List[Position] = [Position(0, 8)] + [Position(1, col) for col in range(2, 8)]
+        self.assertEqual(positions, expected, "Expected the hollows in row-major order")
+
+        mystical: List[Hollow] = [hollow for _, hollow in maze.iter_hollows(MysticalHollow)]
+        self.assertEqual(len(mystical), 6, "Expected six mystical hollow positions")
+        self.assertTrue(all(hollow is mystical[0] for hollow in mystical), "Expected the mystical hollows to be shared")
+        self.assertIsInstance(maze.hollow_at(Position(0, 8)), SpookyHollow)
+        self.assertIsNone(maze.hollow_at(Position(1, 1)), "Expected no hollow at the start position")
+
+        first, second, third = SpookyHollow(), SpookyHollow(), SpookyHollow()
+        maze = Maze(Position(1, 0), [Position(1, 2)], [],
+                    [(third, Position(1, 1)), (second, Position(0, 2)), (first, Position(0, 1))], 2, 3)
+        self.assertEqual([hollow for _, hollow in maze.iter_hollows()], [first, second, third],
+                         "Expected row-major order whatever order the hollows are given in")
+        self.assertEqual([position for position, _ in maze.iter_hollows(SpookyHollow)],
+                         [Position(0, 1), Position(0, 2), Position(1, 1)])
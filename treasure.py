@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from array import array
+from typing import Iterable, List
+
 from config import TreasureConfig
 from random_gen import RandomGen
-from typing import List
 
 
 class Treasure:
-    def __init__(self, value: int, weight: int) -> None:
+    def __init__(self, value: int, weight: int, uid: int | None = None) -> None:
         """
         Complexity:
             O(1)
@@ -14,14 +16,21 @@ class Treasure:
         Args:
             value (int): The value of this treasure
             weight (int): The weight of this treasure
+            uid (int | None): The row of this treasure in the `TreasureTable` it was generated in,
+                None for treasures created outside a table
         """
         self.value: int = value
         self.weight: int = weight
+        self.uid: int | None = uid
 
     def __eq__(self, value: object) -> bool:
         # Do not monitfy this function
         return isinstance(value, Treasure) and value.value == self.value and value.weight == self.weight
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__, the uid is deliberately not part of the hash
+        return hash((self.value, self.weight))
+
     def __str__(self) -> str:
         return f"Treasure: {self.value} ({self.weight}kg)"
 
@@ -29,11 +38,107 @@ class Treasure:
         return str(self)
 
 
-def generate_treasures() -> List[Treasure]:
+class TreasureTable:
+    """
+    Compact struct-of-arrays storage for treasures.
+
+    Values, weights and value-to-weight ratios are kept in parallel typed arrays,
+    and each treasure is identified by its row in the table. Hollows own a contiguous
+    range of rows, and `Treasure` objects are only built when a row is handed back to
+    a caller, carrying their row as `uid`.
+
+    The `held` flags record which rows are still inside a hollow, so a treasure can be removed
+    by its uid in O(1) without searching any hollow.
+    """
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            O(1)
+        """
+        self.values: array = array('l')
+        self.weights: array = array('l')
+        self.ratios: array = array('d')
+        self.held: bytearray = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: int, weight: int) -> int:
+        """
+        Appends a single treasure to the table.
+
+        Args:
+            value (int): The value of the treasure
+            weight (int): The weight of the treasure
+
+        Returns:
+            int: The row the treasure was stored in
+
+        Complexity:
+            O(1) amortised
+        """
+        self.values.append(value)
+        self.weights.append(weight)
+        self.ratios.append(value / weight)
+        self.held.append(1)
+        return len(self.values) - 1
+
+    def extend(self, treasures: Iterable[Treasure]) -> range:
+        """
+        Appends a group of treasures to the table.
+
+        Args:
+            treasures (Iterable[Treasure]): The treasures to store
+
+        Returns:
+            range: The contiguous rows the treasures were stored in
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N) where N is the number of treasures
+        """
+        start = len(self.values)
+        for treasure in treasures:
+            self.add(treasure.value, treasure.weight)
+        return range(start, len(self.values))
+
+    def treasure(self, row: int) -> Treasure:
+        """
+        Builds the `Treasure` stored in the given row.
+
+        Complexity:
+            O(1)
+        """
+        return Treasure(self.values[row], self.weights[row], row)
+
+    def count_held(self, rows: range) -> int:
+        """
+        Counts the rows of a contiguous range whose treasure is still held.
+
+        Complexity:
+            O(N) where N is the number of rows, counted in a single C-level pass over the flags
+        """
+        return self.held[rows.start:rows.stop].count(1)
+
+    def matches(self, row: int, treasure: Treasure) -> bool:
+        """
+        Checks whether the treasure has the same value and weight as the given row.
+
+        Complexity:
+            O(1)
+        """
+        return self.values[row] == treasure.value and self.weights[row] == treasure.weight
+
+
+def generate_treasures(gen: RandomGen | type[RandomGen] = RandomGen) -> List[Treasure]:
     """
     This function will generate a random list of treasures with random values and weights.
     The weights, values and ratios of the treasures will be unique within the output list.
 
+    Args:
+        gen (RandomGen | type[RandomGen]): The generator to draw from, the default stream when not given
+
     Returns:
         list(Treasure): A random list of treasures
 
@@ -42,9 +147,11 @@ def generate_treasures() -> List[Treasure]:
         Worst Case Complexity: O(N) where N is TreasureConfig.MAX_NUMBER_OF_TREASURES.value
 
         This assumes the randint and python set operations can be done in O(1) time.
+        The weights and values are drawn in bulk with RandomGen.randints, in the same order
+        as one randint call each.
     """
-    number_of_treasures = RandomGen.randint(TreasureConfig.MIN_NUMBER_OF_TREASURES.value,
-                                            TreasureConfig.MAX_NUMBER_OF_TREASURES.value)
+    number_of_treasures = gen.randint(TreasureConfig.MIN_NUMBER_OF_TREASURES.value,
+                                      TreasureConfig.MAX_NUMBER_OF_TREASURES.value)
 
     hollow_treasures: List[Treasure | None] = [None] * number_of_treasures
     ratios: set[float] = set()
@@ -53,15 +160,19 @@ def generate_treasures() -> List[Treasure]:
 
     treasure_count: int = 0
     while treasure_count < number_of_treasures:
-        weight: int = RandomGen.randint(1, TreasureConfig.MAX_TREASURE_WEIGHT.value)
-        value: int = RandomGen.randint(1, TreasureConfig.MAX_TREASURE_WEIGHT.value)
-        ratio: float = value / weight
-
-        if ratio not in ratios and weight not in weights_used and value not in values_used:
-            hollow_treasures[treasure_count] = Treasure(value, weight)
-            ratios.add(ratio)
-            weights_used.add(weight)
-            values_used.add(value)
-            treasure_count += 1
+        # Every candidate takes two draws and at most one candidate is kept per missing treasure,
+        # so a round of 2 * missing draws never consumes more of the stream than scalar draws would.
+        draws = gen.randints(1, TreasureConfig.MAX_TREASURE_WEIGHT.value, 2 * (number_of_treasures - treasure_count))
+        for i in range(0, len(draws), 2):
+            weight: int = draws[i]
+            value: int = draws[i + 1]
+            ratio: float = value / weight
+
+            if ratio not in ratios and weight not in weights_used and value not in values_used:
+                hollow_treasures[treasure_count] = Treasure(value, weight)
+                ratios.add(ratio)
+                weights_used.add(weight)
+                values_used.add(value)
+                treasure_count += 1
 
     return hollow_treasures
\ No newline at end of file